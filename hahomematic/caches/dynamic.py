@@ -1,6 +1,7 @@
 """Module for the dynamic caches."""
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 import logging
 from typing import Any, Final
@@ -32,13 +33,26 @@ class DeviceDetailsCache:
         self._device_room: Final[dict[str, str]] = {}
         self._functions: Final[dict[str, set[str]]] = {}
         self._last_updated = INIT_DATETIME
+        self._load_lock: Final = asyncio.Lock()
 
     async def load(self) -> None:
         """Fetch names from backend."""
-        if updated_within_seconds(
-            last_update=self._last_updated, max_age_seconds=(MAX_CACHE_AGE / 2)
-        ):
+        if self._is_recently_updated():
             return
+        async with self._load_lock:
+            # A concurrent call might have loaded the details while waiting for the lock.
+            if self._is_recently_updated():
+                return
+            await self._load()
+
+    def _is_recently_updated(self) -> bool:
+        """Return if the cache has been updated within half of the max cache age."""
+        return updated_within_seconds(
+            last_update=self._last_updated, max_age_seconds=(MAX_CACHE_AGE / 2)
+        )
+
+    async def _load(self) -> None:
+        """Fetch names from backend."""
         self.clear()
         _LOGGER.debug("load: Loading names for %s", self._central.name)
         if client := self._central.primary_client:
@@ -139,9 +153,10 @@ class DeviceDataCache:
     def __init__(self, central: hmcu.CentralUnit) -> None:
         """Init the device data cache."""
         self._central: Final = central
-        # { interface, {channel_address, {parameter, CacheEntry}}}
-        self._central_values_cache: Final[dict[str, dict[str, dict[str, Any]]]] = {}
+        # { (interface, channel_address, parameter), value }
+        self._central_values_cache: Final[dict[tuple[str, str, str], Any]] = {}
         self._last_updated = INIT_DATETIME
+        self._load_lock: Final = asyncio.Lock()
 
     def is_empty(self, max_age_seconds: int) -> bool:
         """Return if cache is empty."""
@@ -156,14 +171,22 @@ class DeviceDataCache:
 
     async def load(self) -> None:
         """Fetch device data from backend."""
-        if updated_within_seconds(
-            last_update=self._last_updated, max_age_seconds=(MAX_CACHE_AGE / 2)
-        ):
+        if self._is_recently_updated():
             return
-        self.clear()
-        _LOGGER.debug("load: device data for %s", self._central.name)
-        if client := self._central.primary_client:
-            await client.fetch_all_device_data()
+        async with self._load_lock:
+            # A concurrent call might have loaded the data while waiting for the lock.
+            if self._is_recently_updated():
+                return
+            self.clear()
+            _LOGGER.debug("load: device data for %s", self._central.name)
+            if client := self._central.primary_client:
+                await client.fetch_all_device_data()
+
+    def _is_recently_updated(self) -> bool:
+        """Return if the cache has been updated within half of the max cache age."""
+        return updated_within_seconds(
+            last_update=self._last_updated, max_age_seconds=(MAX_CACHE_AGE / 2)
+        )
 
     async def refresh_entity_data(
         self, paramset_key: str | None = None, max_age_seconds: int = MAX_CACHE_AGE
@@ -175,7 +198,7 @@ class DeviceDataCache:
                 max_age_seconds=max_age_seconds,
             )
 
-    def add_device_data(self, device_data: dict[str, dict[str, dict[str, Any]]]) -> None:
+    def add_device_data(self, device_data: dict[tuple[str, str, str], Any]) -> None:
         """Add device data to cache."""
         self._central_values_cache.clear()
         self._central_values_cache.update(device_data)
@@ -189,13 +212,11 @@ class DeviceDataCache:
         max_age_seconds: int,
     ) -> Any:
         """Get device data from cache."""
-        if not self.is_empty(max_age_seconds=max_age_seconds):
-            return (
-                self._central_values_cache.get(interface, {})
-                .get(channel_address, {})
-                .get(parameter, NO_CACHE_ENTRY)
-            )
-        return NO_CACHE_ENTRY
+        if self.is_empty(max_age_seconds=max_age_seconds):
+            return NO_CACHE_ENTRY
+        return self._central_values_cache.get(
+            (interface, channel_address, parameter), NO_CACHE_ENTRY
+        )
 
     def clear(self) -> None:
         """Clear the cache."""
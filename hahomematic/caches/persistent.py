@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from abc import ABC
+import asyncio
 from datetime import datetime
 import logging
 import os
@@ -30,6 +31,8 @@ from hahomematic.support import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_SAVE_DEBOUNCE_DELAY: Final = 1.0
+
 
 class BasePersistentCache(ABC):
     """Cache for files."""
@@ -45,10 +48,48 @@ class BasePersistentCache(ABC):
         self._cache_dir: Final = f"{central.config.storage_folder}/cache"
         self._filename: Final = f"{central.name}_{filename}"
         self._persistant_cache: Final = persistant_cache
+        self._scheduled_save: asyncio.TimerHandle | None = None
+        self._save_task: asyncio.Task[HmDataOperationResult] | None = None
         self.last_save: datetime = INIT_DATETIME
 
+    def save_debounced(self, delay: float = _SAVE_DEBOUNCE_DELAY) -> None:
+        """Schedule a save to disk. All calls within the delay result in a single save."""
+        if self._scheduled_save is not None:
+            return
+        self._scheduled_save = asyncio.get_running_loop().call_later(
+            delay, self._run_scheduled_save
+        )
+
+    def _run_scheduled_save(self) -> None:
+        """Run the scheduled save."""
+        self._scheduled_save = None
+        self._save_task = save_task = asyncio.get_running_loop().create_task(
+            self.save(), name=f"save_debounced_{self._filename}"
+        )
+        save_task.add_done_callback(self._save_task_done)
+
+    def _save_task_done(self, save_task: asyncio.Task[HmDataOperationResult]) -> None:
+        """Release the finished debounced save."""
+        if self._save_task is save_task:
+            self._save_task = None
+
+    def _cancel_scheduled_save(self) -> None:
+        """Cancel a scheduled save."""
+        if self._scheduled_save is not None:
+            self._scheduled_save.cancel()
+            self._scheduled_save = None
+
+    async def save_scheduled(self) -> HmDataOperationResult:
+        """Save to disk immediately, if a debounced save is scheduled or still running."""
+        if self._scheduled_save is not None:
+            return await self.save()
+        if (save_task := self._save_task) is not None:
+            return await save_task
+        return HmDataOperationResult.NO_SAVE
+
     async def save(self) -> HmDataOperationResult:
         """Save current name data in NAMES to disk."""
+        self._cancel_scheduled_save()
 
         def _save() -> HmDataOperationResult:
             if not check_or_create_directory(self._cache_dir):
@@ -90,6 +131,7 @@ class BasePersistentCache(ABC):
 
     async def clear(self) -> None:
         """Remove stored file from disk."""
+        self._cancel_scheduled_save()
 
         def _clear() -> None:
             check_or_create_directory(self._cache_dir)
@@ -278,23 +320,15 @@ class ParamsetDescriptionCache(BasePersistentCache):
         paramset_description: dict[str, Any],
     ) -> None:
         """Add paramset description to cache."""
-        if interface_id not in self._raw_paramset_descriptions:
-            self._raw_paramset_descriptions[interface_id] = {}
-        if channel_address not in self._raw_paramset_descriptions[interface_id]:
-            self._raw_paramset_descriptions[interface_id][channel_address] = {}
-        if paramset_key not in self._raw_paramset_descriptions[interface_id][channel_address]:
-            self._raw_paramset_descriptions[interface_id][channel_address][paramset_key] = {}
-
-        self._raw_paramset_descriptions[interface_id][channel_address][
-            paramset_key
-        ] = paramset_description
+        self._raw_paramset_descriptions.setdefault(interface_id, {}).setdefault(
+            channel_address, {}
+        )[paramset_key] = paramset_description
 
     async def remove_device(self, device: HmDevice) -> None:
         """Remove device paramset descriptions from cache."""
         if interface := self._raw_paramset_descriptions.get(device.interface_id):
             for channel_address in device.channels:
-                if channel_address in interface:
-                    del self._raw_paramset_descriptions[device.interface_id][channel_address]
+                interface.pop(channel_address, None)
         await self.save()
 
     def has_interface_id(self, interface_id: str) -> bool:
@@ -405,3 +439,8 @@ class ParamsetDescriptionCache(BasePersistentCache):
         result = await super().save()
         self._init_address_parameter_list()
         return result
+
+    def save_debounced(self, delay: float = _SAVE_DEBOUNCE_DELAY) -> None:
+        """Schedule a save to disk, but update the address parameter list immediately."""
+        self._init_address_parameter_list()
+        super().save_debounced(delay=delay)
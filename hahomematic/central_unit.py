@@ -14,7 +14,7 @@ import socket
 import threading
 from typing import Any, Final, TypeVar, cast
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, TCPConnector
 import orjson
 
 from hahomematic import client as hmcl, config, xml_rpc_server as xmlrpc
@@ -77,6 +77,9 @@ _LOGGER = logging.getLogger(__name__)
 _R = TypeVar("_R")
 _T = TypeVar("_T")
 
+_XML_RPC_CONNECTION_LIMIT_PER_HOST: Final = 8
+_XML_RPC_KEEPALIVE_TIMEOUT: Final = 60
+
 # {instance_name, central_unit}
 CENTRAL_INSTANCES: Final[dict[str, CentralUnit]] = {}
 ConnectionProblemIssuer = JsonRpcAioHttpClient | XmlRpcProxy
@@ -100,6 +103,8 @@ class CentralUnit:
         self._attr_model: str | None = None
         self._connection_state: Final = central_config.connection_state
         self._loop: Final = asyncio.get_running_loop()
+        # Shared session for the XmlRPC requests of all proxies.
+        self._xml_rpc_client_session: ClientSession | None = None
         self._xml_rpc_server: Final = (
             xmlrpc.register_xml_rpc_server(
                 local_port=central_config.callback_port or central_config.default_callback_port
@@ -136,6 +141,8 @@ class CentralUnit:
         self._firmware_update_entities: Final[dict[str, HmUpdate]] = {}
         # {device_address, device}
         self._devices: Final[dict[str, HmDevice]] = {}
+        # Increased on every change of _devices
+        self._devices_revision: int = 0
         # {sysvar_name, sysvar_entity}
         self.sysvar_entities: Final[dict[str, GenericSystemVariable]] = {}
         # {sysvar_name, program_button}U
@@ -177,6 +184,11 @@ class CentralUnit:
         """Return a tuple of devices."""
         return tuple(self._devices.values())
 
+    @property
+    def devices_revision(self) -> int:
+        """Return the revision of the devices. Changes, if devices are added or removed."""
+        return self._devices_revision
+
     @property
     def _has_active_threads(self) -> bool:
         """Return if active sub threads are alive."""
@@ -221,6 +233,17 @@ class CentralUnit:
         """Return the name of the backend."""
         return self._attr_name
 
+    def get_xml_rpc_client_session(self) -> ClientSession:
+        """Return the client session shared by all XmlRPC proxies of the central."""
+        if self._xml_rpc_client_session is None or self._xml_rpc_client_session.closed:
+            self._xml_rpc_client_session = ClientSession(
+                connector=TCPConnector(
+                    limit_per_host=_XML_RPC_CONNECTION_LIMIT_PER_HOST,
+                    keepalive_timeout=_XML_RPC_KEEPALIVE_TIMEOUT,
+                )
+            )
+        return self._xml_rpc_client_session
+
     @property
     def supports_ping_pong(self) -> bool:
         """Return the backend supports ping pong."""
@@ -268,9 +291,14 @@ class CentralUnit:
             _LOGGER.debug("STOP: Cental %s not started", self._attr_name)
             return
         self._stop_connection_checker()
+        # Don't lose paramset descriptions, that are waiting for a debounced save.
+        await self.paramset_descriptions.save_scheduled()
         await self._stop_clients()
         if self.json_rpc_client.is_activated:
             await self.json_rpc_client.logout()
+        await self.json_rpc_client.close()
+        if self._xml_rpc_client_session and not self._xml_rpc_client_session.closed:
+            await self._xml_rpc_client_session.close()
 
         if self._xml_rpc_server:
             # un-register this instance from XmlRPC-Server
@@ -349,9 +377,6 @@ class CentralUnit:
     async def _stop_clients(self) -> None:
         """Stop clients."""
         await self._de_init_clients()
-        for client in self._clients.values():
-            _LOGGER.debug("STOP_CLIENTS: Stopping %s", client.interface_id)
-            client.stop()
         _LOGGER.debug("STOP_CLIENTS: Clearing existing clients.")
         self._clients.clear()
 
@@ -415,14 +440,35 @@ class CentralUnit:
 
     async def _init_clients(self) -> None:
         """Init clients of control unit, and start connection checker."""
-        for client in self._clients.values():
-            if await client.proxy_init() == HmProxyInitState.INIT_SUCCESS:
+        clients = list(self._clients.values())
+        results = await asyncio.gather(
+            *(client.proxy_init() for client in clients), return_exceptions=True
+        )
+        for client, result in zip(clients, results):
+            if isinstance(result, BaseException):
+                _LOGGER.warning(
+                    "INIT_CLIENTS failed: Unable to init client for %s [%s]",
+                    client.interface_id,
+                    reduce_args(args=result.args),
+                )
+            elif result == HmProxyInitState.INIT_SUCCESS:
                 _LOGGER.debug("INIT_CLIENTS: client for %s initialized", client.interface_id)
 
     async def _de_init_clients(self) -> None:
         """De-init clients."""
-        for name, client in self._clients.items():
-            if await client.proxy_de_init():
+        names = list(self._clients)
+        results = await asyncio.gather(
+            *(client.proxy_de_init() for client in self._clients.values()),
+            return_exceptions=True,
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                _LOGGER.warning(
+                    "STOP failed: Unable to de-init proxy %s [%s]",
+                    name,
+                    reduce_args(args=result.args),
+                )
+            elif result:
                 _LOGGER.debug("STOP: Proxy de-initialized: %s", name)
 
     async def _init_hub(self) -> None:
@@ -454,26 +500,34 @@ class CentralUnit:
 
         # Do not add: pylint disable=no-member
         # This is only an issue on macOS
-        def get_local_ip(host: str) -> str | None:
+        async def get_local_ip(host: str) -> str | None:
             """Get local_ip from socket."""
             try:
-                socket.gethostbyname(host)
-            except Exception as exc:
+                addr_infos = await self._loop.getaddrinfo(
+                    host, port, family=socket.AF_INET, type=socket.SOCK_DGRAM
+                )
+            except OSError as exc:
                 message = f"GET_LOCAL_IP: Can't resolve host for {host}"
                 _LOGGER.warning(message)
                 raise HaHomematicException(message) from exc
-            tmp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            tmp_socket.settimeout(config.TIMEOUT)
-            tmp_socket.connect((host, port))
-            local_ip = str(tmp_socket.getsockname()[0])
-            tmp_socket.close()
+            # Connecting an UDP socket does not send any packets,
+            # it only selects the local interface used to reach the host.
+            try:
+                with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as tmp_socket:
+                    tmp_socket.setblocking(False)
+                    tmp_socket.connect(addr_infos[0][4])
+                    local_ip = str(tmp_socket.getsockname()[0])
+            except OSError as ose:
+                message = f"GET_LOCAL_IP: Can't connect to host {host} [{ose.strerror}]"
+                _LOGGER.warning(message)
+                raise HaHomematicException(message) from ose
             _LOGGER.debug("GET_LOCAL_IP: Got local ip: %s", local_ip)
             return local_ip
 
         callback_ip: str | None = None
         while callback_ip is None:
             try:
-                callback_ip = await self.async_add_executor_job(get_local_ip, self.config.host)
+                callback_ip = await get_local_ip(self.config.host)
             except HaHomematicException:
                 callback_ip = "127.0.0.1"
             if callback_ip is None:
@@ -525,11 +579,11 @@ class CentralUnit:
 
     def get_client(self, interface_id: str) -> hmcl.Client:
         """Return a client by interface_id."""
-        if not self.has_client(interface_id=interface_id):
+        if (client := self._clients.get(interface_id)) is None:
             raise HaHomematicException(
                 f"get_client: interface_id {interface_id} does not exist on {self._attr_name}"
             )
-        return self._clients[interface_id]
+        return client
 
     def get_device(self, address: str) -> HmDevice | None:
         """Return homematic device."""
@@ -594,9 +648,9 @@ class CentralUnit:
     def get_virtual_remotes(self) -> list[HmDevice]:
         """Get the virtual remote for the Client."""
         return [
-            cl.get_virtual_remote()  # type: ignore[misc]
+            virtual_remote
             for cl in self._clients.values()
-            if cl.get_virtual_remote() is not None
+            if (virtual_remote := cl.get_virtual_remote()) is not None
         ]
 
     def has_client(self, interface_id: str) -> bool:
@@ -665,6 +719,7 @@ class CentralUnit:
                         await device.load_value_cache()
                         new_devices.add(device)
                         self._devices[device_address] = device
+                        self._devices_revision += 1
                 except Exception as err:  # pragma: no cover
                     _LOGGER.error(
                         "CREATE_DEVICES failed: %s [%s] Unable to create entities: %s, %s",
@@ -742,22 +797,26 @@ class CentralUnit:
 
         async with self._sema_add_devices:
             # We need this list to avoid adding duplicates.
-            known_addresses = [
+            known_addresses = {
                 dev_desc[HmDescription.ADDRESS]
                 for dev_desc in self.device_descriptions.get_raw_device_descriptions(interface_id)
-            ]
+            }
             client = self._clients[interface_id]
+            new_device_descriptions: list[dict[str, Any]] = []
             for dev_desc in device_descriptions:
                 try:
                     self.device_descriptions.add_device_description(interface_id, dev_desc)
                     if dev_desc[HmDescription.ADDRESS] not in known_addresses:
-                        await client.fetch_paramset_descriptions(dev_desc)
+                        new_device_descriptions.append(dev_desc)
                 except Exception as err:  # pragma: no cover
                     _LOGGER.error(
                         "ADD_NEW_DEVICES failed: %s [%s]",
                         type(err).__name__,
                         reduce_args(args=err.args),
                     )
+            await client.fetch_all_paramset_descriptions(
+                device_descriptions=new_device_descriptions
+            )
 
             await self.device_descriptions.save()
             await self.paramset_descriptions.save()
@@ -848,6 +907,7 @@ class CentralUnit:
         await self.paramset_descriptions.remove_device(device=device)
         self.device_details.remove_device(device=device)
         del self._devices[device.device_address]
+        self._devices_revision += 1
 
     def remove_entity(self, entity: BaseEntity) -> None:
         """Remove entity to central collections."""
@@ -994,6 +1054,12 @@ class CentralUnit:
         else:
             _LOGGER.warning("Variable %s not found on %s", name, self.name)
 
+    async def set_system_variables(self, values: dict[str, Any]) -> None:
+        """Set multiple variable values on CCU/Homegear concurrently."""
+        await asyncio.gather(
+            *(self.set_system_variable(name=name, value=value) for name, value in values.items())
+        )
+
     # pylint: disable=invalid-name
     async def set_install_mode(
         self,
@@ -3,18 +3,25 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
+import time
 from typing import Any, Final, cast
 
 from hahomematic import central_unit as hmcu
-from hahomematic.config import CALLBACK_WARN_INTERVAL, RECONNECT_WAIT
+from hahomematic.config import (
+    CALLBACK_WARN_INTERVAL,
+    PARAMSET_FETCH_CONCURRENCY,
+    PING_SKIP_INTERVAL,
+    RECONNECT_WAIT,
+)
 from hahomematic.const import (
     EVENT_AVAILABLE,
     EVENT_SECONDS_SINCE_LAST_EVENT,
     HM_VIRTUAL_REMOTE_TYPES,
     HOMEGEAR_SERIAL,
     INIT_DATETIME,
+    INIT_TIMESTAMP,
     HmBackend,
     HmCallSource,
     HmDescription,
@@ -41,6 +48,7 @@ from hahomematic.xml_rpc_proxy import XmlRpcProxy
 
 _LOGGER = logging.getLogger(__name__)
 
+
 _ADDRESS: Final = "address"
 _CHANNELS: Final = "channels"
 _ID: Final = "id"
@@ -64,7 +72,14 @@ class Client(ABC):
         self._attr_available: bool = True
         self._connection_error_count: int = 0
         self._is_callback_alive: bool = True
-        self.last_updated: datetime = INIT_DATETIME
+        # Limits the concurrent paramset description and metadata requests to the backend.
+        self._sema_fetch_requests: Final = asyncio.Semaphore(PARAMSET_FETCH_CONCURRENCY)
+        # monotonic timestamp of the last event or successful check of the backend
+        self.last_updated_monotonic: float = INIT_TIMESTAMP
+        # monotonic timestamp of the last successful init, check or write request
+        self._last_request_monotonic: float = INIT_TIMESTAMP
+        # (devices_revision of central, virtual remote)
+        self._virtual_remote: tuple[int, HmDevice | None] | None = None
 
         self._proxy: XmlRpcProxy
         self._proxy_read: XmlRpcProxy
@@ -74,12 +89,19 @@ class Client(ABC):
         """Init the client."""
         self.system_information = await self._get_system_information()
         self._proxy = self._config.get_xml_rpc_proxy(
-            auth_enabled=self.system_information.auth_enabled
+            auth_enabled=self.system_information.auth_enabled, serialize_requests=True
         )
         self._proxy_read = self._config.get_xml_rpc_proxy(
             auth_enabled=self.system_information.auth_enabled
         )
 
+    @property
+    def last_updated(self) -> datetime:
+        """Return the last update of the client."""
+        if self.last_updated_monotonic == INIT_TIMESTAMP:
+            return INIT_DATETIME
+        return datetime.now() - timedelta(seconds=time.monotonic() - self.last_updated_monotonic)
+
     @property
     def available(self) -> bool:
         """Return the availability of the client."""
@@ -104,6 +126,7 @@ class Client(ABC):
                 forced_availability=HmForcedDeviceAvailability.NOT_SET
             )
             _LOGGER.debug("PROXY_INIT: Proxy for %s initialized", self.interface_id)
+            self._last_request_monotonic = time.monotonic()
         except BaseHomematicException as hhe:
             _LOGGER.warning(
                 "PROXY_INIT failed: %s [%s] Unable to initialize proxy for %s",
@@ -111,14 +134,15 @@ class Client(ABC):
                 reduce_args(args=hhe.args),
                 self.interface_id,
             )
-            self.last_updated = INIT_DATETIME
+            self.last_updated_monotonic = INIT_TIMESTAMP
+            self._last_request_monotonic = INIT_TIMESTAMP
             return HmProxyInitState.INIT_FAILED
-        self.last_updated = datetime.now()
+        self.last_updated_monotonic = time.monotonic()
         return HmProxyInitState.INIT_SUCCESS
 
     async def proxy_de_init(self) -> HmProxyInitState:
         """De-init to stop CCU from sending events for this remote."""
-        if self.last_updated == INIT_DATETIME:
+        if self.last_updated_monotonic == INIT_TIMESTAMP:
             _LOGGER.debug(
                 "PROXY_DE_INIT: Skipping de-init for %s (not initialized)",
                 self.interface_id,
@@ -136,7 +160,8 @@ class Client(ABC):
             )
             return HmProxyInitState.DE_INIT_FAILED
 
-        self.last_updated = INIT_DATETIME
+        self.last_updated_monotonic = INIT_TIMESTAMP
+        self._last_request_monotonic = INIT_TIMESTAMP
         return HmProxyInitState.DE_INIT_SUCCESS
 
     async def proxy_re_init(self) -> HmProxyInitState:
@@ -176,6 +201,8 @@ class Client(ABC):
             )
             await asyncio.sleep(RECONNECT_WAIT)
 
+            # The backend might have been restarted with a changed configuration.
+            self._json_rpc_client.clear_backend_info()
             await self.proxy_re_init()
             _LOGGER.info(
                 "RECONNECT: re-connected client %s",
@@ -184,11 +211,6 @@ class Client(ABC):
             return True
         return False
 
-    def stop(self) -> None:
-        """Stop depending services."""
-        self._proxy.stop()
-        self._proxy_read.stop()
-
     @abstractmethod
     async def fetch_all_device_data(self) -> None:
         """Fetch all device data from CCU."""
@@ -202,9 +224,15 @@ class Client(ABC):
         Perform actions required for connectivity check.
 
         Connection is not connected, if three consecutive checks fail.
+        The check is skipped, if a request to the backend has succeeded recently.
         Return connectivity state.
         """
-        if await self.check_connection_availability() is True:
+        if (
+            _is_within_seconds(
+                timestamp=self._last_request_monotonic, max_age_seconds=PING_SKIP_INTERVAL
+            )
+            or await self.check_connection_availability() is True
+        ):
             self._connection_error_count = 0
         else:
             self._connection_error_count += 1
@@ -215,9 +243,13 @@ class Client(ABC):
             )
             return False
 
-        if (datetime.now() - self.last_updated).total_seconds() < CALLBACK_WARN_INTERVAL:
-            return True
-        return False
+        return self._updated_within_seconds(max_age_seconds=CALLBACK_WARN_INTERVAL)
+
+    def _updated_within_seconds(self, max_age_seconds: float) -> bool:
+        """Return if the client has been updated within the given seconds."""
+        return _is_within_seconds(
+            timestamp=self.last_updated_monotonic, max_age_seconds=max_age_seconds
+        )
 
     def is_callback_alive(self) -> bool:
         """Return if XmlRPC-Server is alive based on received events for this client."""
@@ -292,6 +324,13 @@ class Client(ABC):
 
     def get_virtual_remote(self) -> HmDevice | None:
         """Get the virtual remote for the Client."""
+        devices_revision = self.central.devices_revision
+        if self._virtual_remote is None or self._virtual_remote[0] != devices_revision:
+            self._virtual_remote = (devices_revision, self._find_virtual_remote())
+        return self._virtual_remote[1]
+
+    def _find_virtual_remote(self) -> HmDevice | None:
+        """Find the virtual remote for the Client."""
         for device_type in HM_VIRTUAL_REMOTE_TYPES:
             for device in self.central.devices:
                 if device.interface_id == self.interface_id and device.device_type == device_type:
@@ -330,15 +369,12 @@ class Client(ABC):
     ) -> bool:
         """Activate or deactivate installmode on CCU / Homegear."""
         try:
-            args: list[Any] = [on]
-            if on and t:
-                args.append(t)
-                if device_address:
-                    args.append(device_address)
-                else:
-                    args.append(mode)
-
-            await self._proxy.setInstallMode(*args)
+            if not (on and t):
+                await self._proxy.setInstallMode(on)
+            elif device_address:
+                await self._proxy.setInstallMode(on, t, device_address)
+            else:
+                await self._proxy.setInstallMode(on, t, mode)
         except BaseHomematicException as hhe:
             _LOGGER.warning(
                 "SET_INSTALL_MODE failed: %s [%s]", hhe.name, reduce_args(args=hhe.args)
@@ -403,6 +439,7 @@ class Client(ABC):
                 await self._proxy.setValue(channel_address, parameter, value, rx_mode)
             else:
                 await self._proxy.setValue(channel_address, parameter, value)
+            self._last_request_monotonic = time.monotonic()
         except BaseHomematicException as hhe:
             _LOGGER.warning(
                 "SET_VALUE failed with %s [%s]: %s, %s, %s",
@@ -481,6 +518,7 @@ class Client(ABC):
                 await self._proxy.putParamset(address, paramset_key, value, rx_mode)
             else:
                 await self._proxy.putParamset(address, paramset_key, value)
+            self._last_request_monotonic = time.monotonic()
         except BaseHomematicException as hhe:
             _LOGGER.warning(
                 "PUT_PARAMSET failed: %s [%s] %s, %s, %s",
@@ -519,7 +557,7 @@ class Client(ABC):
                 channel_address,
             )
         if save_to_file:
-            await self.central.paramset_descriptions.save()
+            self.central.paramset_descriptions.save_debounced()
 
     async def fetch_paramset_descriptions(self, device_description: dict[str, Any]) -> None:
         """Fetch paramsets for provided device description."""
@@ -544,55 +582,92 @@ class Client(ABC):
         address = device_description[HmDescription.ADDRESS]
         paramsets[address] = {}
         _LOGGER.debug("GET_PARAMSET_DESCRIPTIONS for %s", address)
-        for paramset_key in device_description.get(HmDescription.PARAMSETS, []):
-            if (channel_no := get_channel_no(address)) is None:
-                # No paramsets at root device
-                continue
-
-            device_type = (
-                device_description[HmDescription.TYPE]
-                if channel_no is None
-                else device_description[HmDescription.PARENT_TYPE]
-            )
-            if (
-                only_relevant
-                and channel_no
-                and not self.central.parameter_visibility.is_relevant_paramset(
+        if (channel_no := get_channel_no(address)) is None:
+            # No paramsets at root device
+            return paramsets
+
+        if not (paramset_keys := device_description.get(HmDescription.PARAMSETS, [])):
+            return paramsets
+
+        if only_relevant and channel_no:
+            device_type = device_description[HmDescription.PARENT_TYPE]
+            paramset_keys = [
+                paramset_key
+                for paramset_key in paramset_keys
+                if self.central.parameter_visibility.is_relevant_paramset(
                     device_type=device_type,
                     channel_no=channel_no,
                     paramset_key=paramset_key,
                 )
-            ):
-                continue
-            try:
-                paramsets[address][paramset_key] = await self._get_paramset_description(
-                    address=address, paramset_key=paramset_key
-                )
-            except BaseHomematicException as hhe:
+            ]
+        results = await asyncio.gather(
+            *(
+                self._get_paramset_description(address=address, paramset_key=paramset_key)
+                for paramset_key in paramset_keys
+            ),
+            return_exceptions=True,
+        )
+        for paramset_key, result in zip(paramset_keys, results, strict=True):
+            if isinstance(result, BaseHomematicException):
                 _LOGGER.warning(
                     "GET_PARAMSET_DESCRIPTIONS failed with %s [%s] for %s address %s",
-                    hhe.name,
-                    reduce_args(args=hhe.args),
+                    result.name,
+                    reduce_args(args=result.args),
                     paramset_key,
                     address,
                 )
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            paramsets[address][paramset_key] = result
         return paramsets
 
     async def _get_paramset_description(self, address: str, paramset_key: str) -> Any:
         """Get paramset description from CCU."""
-        return await self._proxy_read.getParamsetDescription(address, paramset_key)
+        async with self._sema_fetch_requests:
+            return await self._proxy_read.getParamsetDescription(address, paramset_key)
+
+    async def fetch_all_paramset_descriptions(
+        self, device_descriptions: list[dict[str, Any]]
+    ) -> None:
+        """Fetch paramsets for provided device descriptions concurrently."""
+        results = await asyncio.gather(
+            *(
+                self.fetch_paramset_descriptions(device_description=device_description)
+                for device_description in device_descriptions
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "FETCH_ALL_PARAMSET_DESCRIPTIONS failed: %s [%s]",
+                    type(result).__name__,
+                    reduce_args(args=result.args),
+                )
 
     async def get_all_paramset_descriptions(
         self, device_descriptions: list[dict[str, Any]]
     ) -> dict[str, dict[str, Any]]:
         """Get all paramset descriptions for provided device descriptions."""
         all_paramsets: dict[str, dict[str, Any]] = {}
-        for device_description in device_descriptions:
-            all_paramsets.update(
-                await self.get_paramset_descriptions(
+        for paramsets in await asyncio.gather(
+            *(
+                self.get_paramset_descriptions(
                     device_description=device_description, only_relevant=False
                 )
-            )
+                for device_description in device_descriptions
+            ),
+            return_exceptions=True,
+        ):
+            if isinstance(paramsets, Exception):
+                _LOGGER.error(
+                    "GET_ALL_PARAMSET_DESCRIPTIONS failed: %s [%s]",
+                    type(paramsets).__name__,
+                    reduce_args(args=paramsets.args),
+                )
+                continue
+            all_paramsets.update(cast(dict[str, dict[str, Any]], paramsets))
         return all_paramsets
 
     async def update_device_firmware(self, device_address: str) -> bool:
@@ -654,7 +729,7 @@ class Client(ABC):
                 interface_id=self.interface_id, device_address=device_address
             ),
         )
-        await self.central.paramset_descriptions.save()
+        self.central.paramset_descriptions.save_debounced()
 
 
 class ClientCCU(Client):
@@ -674,19 +749,18 @@ class ClientCCU(Client):
     async def fetch_device_details(self) -> None:
         """Get all names via JSON-RPS and store in data.NAMES."""
         if json_result := await self._json_rpc_client.get_device_details():
+            device_details = self.central.device_details
+            add_name = device_details.add_name
+            add_device_channel_id = device_details.add_device_channel_id
             for device in json_result:
-                self.central.device_details.add_name(address=device[_ADDRESS], name=device[_NAME])
-                self.central.device_details.add_device_channel_id(
-                    address=device[_ADDRESS], channel_id=device[_ID]
-                )
+                device_address = device[_ADDRESS]
+                add_name(address=device_address, name=device[_NAME])
+                add_device_channel_id(address=device_address, channel_id=device[_ID])
                 for channel in device.get(_CHANNELS, []):
-                    self.central.device_details.add_name(
-                        address=channel[_ADDRESS], name=channel[_NAME]
-                    )
-                    self.central.device_details.add_device_channel_id(
-                        address=channel[_ADDRESS], channel_id=channel[_ID]
-                    )
-                self.central.device_details.add_interface(device[_ADDRESS], device[_INTERFACE])
+                    channel_address = channel[_ADDRESS]
+                    add_name(address=channel_address, name=channel[_NAME])
+                    add_device_channel_id(address=channel_address, channel_id=channel[_ID])
+                device_details.add_interface(device_address, device[_INTERFACE])
         else:
             _LOGGER.debug("FETCH_DEVICE_DETAILS: Unable to fetch device details via JSON-RPC")
 
@@ -705,7 +779,7 @@ class ClientCCU(Client):
         """Check if _proxy is still initialized."""
         try:
             await self._proxy.ping(self.interface_id)
-            self.last_updated = datetime.now()
+            self.last_updated_monotonic = self._last_request_monotonic = time.monotonic()
             self.central.increase_ping_count(interface_id=self.interface_id)
             return True
         except BaseHomematicException as hhe:
@@ -714,7 +788,7 @@ class ClientCCU(Client):
                 hhe.name,
                 reduce_args(args=hhe.args),
             )
-        self.last_updated = INIT_DATETIME
+        self.last_updated_monotonic = self._last_request_monotonic = INIT_TIMESTAMP
         return False
 
     async def execute_program(self, pid: str) -> bool:
@@ -803,14 +877,13 @@ class ClientHomegear(Client):
     async def fetch_device_details(self) -> None:
         """Get all names from metadata (Homegear)."""
         _LOGGER.debug("FETCH_DEVICE_DETAILS: Fetching names via Metadata")
-        for address in self.central.device_descriptions.get_device_descriptions(
-            interface_id=self.interface_id
-        ):
+
+        async def _fetch_name(address: str) -> None:
+            """Fetch the name of a single device from metadata."""
             try:
-                self.central.device_details.add_name(
-                    address,
-                    await self._proxy_read.getMetadata(address, HmDescription.NAME),
-                )
+                async with self._sema_fetch_requests:
+                    name = await self._proxy_read.getMetadata(address, HmDescription.NAME)
+                self.central.device_details.add_name(address, name)
             except BaseHomematicException as hhe:
                 _LOGGER.warning(
                     "%s [%s] Failed to fetch name for device %s",
@@ -819,11 +892,27 @@ class ClientHomegear(Client):
                     address,
                 )
 
+        for result in await asyncio.gather(
+            *(
+                _fetch_name(address)
+                for address in self.central.device_descriptions.get_device_descriptions(
+                    interface_id=self.interface_id
+                )
+            ),
+            return_exceptions=True,
+        ):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "FETCH_DEVICE_DETAILS failed: %s [%s]",
+                    type(result).__name__,
+                    reduce_args(args=result.args),
+                )
+
     async def check_connection_availability(self) -> bool:
         """Check if proxy is still initialized."""
         try:
             await self._proxy.clientServerInitialized(self.interface_id)
-            self.last_updated = datetime.now()
+            self.last_updated_monotonic = self._last_request_monotonic = time.monotonic()
             if self.supports_ping_pong:
                 self.central.increase_ping_count(interface_id=self.interface_id)
             return True
@@ -833,7 +922,7 @@ class ClientHomegear(Client):
                 hhe.name,
                 reduce_args(args=hhe.args),
             )
-        self.last_updated = INIT_DATETIME
+        self.last_updated_monotonic = self._last_request_monotonic = INIT_TIMESTAMP
         return False
 
     async def execute_program(self, pid: str) -> bool:
@@ -934,6 +1023,10 @@ class _ClientConfig:
             path=interface_config.remote_path,
             tls=central.config.tls,
         )
+        self._xml_rpc_headers: Final = build_headers(
+            username=central.config.username,
+            password=central.config.password,
+        )
 
     async def get_client(self) -> Client:
         """Identify the used client."""
@@ -960,42 +1053,33 @@ class _ClientConfig:
         except Exception as exc:
             raise NoConnection(f"Unable to connect {reduce_args(args=exc.args)}.") from exc
 
-    def get_xml_rpc_proxy(self, auth_enabled: bool | None = None) -> XmlRpcProxy:
+    def get_xml_rpc_proxy(
+        self, auth_enabled: bool | None = None, serialize_requests: bool = False
+    ) -> XmlRpcProxy:
         """Return a XmlRPC proxy for backend communication."""
-        central_config = self.central.config
-        xml_rpc_headers = (
-            build_headers(
-                username=central_config.username,
-                password=central_config.password,
-            )
-            if auth_enabled
-            else []
-        )
-        return XmlRpcProxy(
-            max_workers=1,
-            interface_id=self.interface_id,
-            connection_state=central_config.connection_state,
-            uri=self.xml_rpc_uri,
-            headers=xml_rpc_headers,
-            tls=central_config.tls,
-            verify_tls=central_config.verify_tls,
+        return self._create_xml_rpc_proxy(
+            xml_rpc_headers=self._xml_rpc_headers if auth_enabled else [],
+            serialize_requests=serialize_requests,
         )
 
     def _get_simple_xml_rpc_proxy(self) -> XmlRpcProxy:
         """Return a XmlRPC proxy for backend communication."""
+        return self._create_xml_rpc_proxy(xml_rpc_headers=self._xml_rpc_headers)
+
+    def _create_xml_rpc_proxy(
+        self, xml_rpc_headers: list[tuple[str, str]], serialize_requests: bool = False
+    ) -> XmlRpcProxy:
+        """Create a XmlRPC proxy with the given headers."""
         central_config = self.central.config
-        xml_rpc_headers = build_headers(
-            username=central_config.username,
-            password=central_config.password,
-        )
         return XmlRpcProxy(
-            max_workers=0,
             interface_id=self.interface_id,
             connection_state=central_config.connection_state,
+            get_client_session=self.central.get_xml_rpc_client_session,
             uri=self.xml_rpc_uri,
             headers=xml_rpc_headers,
             tls=central_config.tls,
             verify_tls=central_config.verify_tls,
+            serialize_requests=serialize_requests,
         )
 
 
@@ -1037,6 +1121,13 @@ async def create_client(
     ).get_client()
 
 
+def _is_within_seconds(timestamp: float, max_age_seconds: float) -> bool:
+    """Return if the monotonic timestamp is set and younger than the given seconds."""
+    if timestamp == INIT_TIMESTAMP:
+        return False
+    return time.monotonic() - timestamp < max_age_seconds
+
+
 def get_client(interface_id: str) -> Client | None:
     """Return client by interface_id."""
     for central in hmcu.CENTRAL_INSTANCES.values():
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from hahomematic.const import (
     DEFAULT_CONNECTION_CHECKER_INTERVAL,
+    DEFAULT_PARAMSET_FETCH_CONCURRENCY,
     DEFAULT_PING_PONG_MISMATCH_COUNT,
     DEFAULT_RECONNECT_WAIT,
     DEFAULT_TIMEOUT,
@@ -10,6 +11,8 @@ from hahomematic.const import (
 
 CALLBACK_WARN_INTERVAL = DEFAULT_CONNECTION_CHECKER_INTERVAL * 40
 CONNECTION_CHECKER_INTERVAL = DEFAULT_CONNECTION_CHECKER_INTERVAL
+PARAMSET_FETCH_CONCURRENCY = DEFAULT_PARAMSET_FETCH_CONCURRENCY
 PING_PONG_MISMATCH_COUNT = DEFAULT_PING_PONG_MISMATCH_COUNT
+PING_SKIP_INTERVAL = DEFAULT_CONNECTION_CHECKER_INTERVAL / 2
 RECONNECT_WAIT = DEFAULT_RECONNECT_WAIT
 TIMEOUT = DEFAULT_TIMEOUT
@@ -9,6 +9,7 @@ DEFAULT_CONNECTION_CHECKER_INTERVAL: Final = (
     15  # check if connection is available via rpc ping every:
 )
 DEFAULT_ENCODING: Final = "UTF-8"
+DEFAULT_PARAMSET_FETCH_CONCURRENCY: Final = 8  # max parallel fetch requests per client
 DEFAULT_PING_PONG_MISMATCH_COUNT: Final = 10
 DEFAULT_RECONNECT_WAIT: Final = 120  # wait with reconnect after a first ping was successful
 DEFAULT_TIMEOUT: Final = 60  # default timeout for a connection
@@ -22,6 +23,7 @@ CCU_PASSWORD_PATTERN: Final = r"[A-Za-z0-9.!$():;#-]{0,}"
 
 IDENTIFIER_SEPARATOR: Final = "@"
 INIT_DATETIME: Final = datetime.strptime("01.01.1970 00:00:00", "%d.%m.%Y %H:%M:%S")
+INIT_TIMESTAMP: Final = 0.0
 IP_ANY_V4: Final = "0.0.0.0"
 PORT_ANY: Final = 0
 
@@ -1,7 +1,7 @@
 """Module to support hahomematic eco system."""
 from __future__ import annotations
 
-from copy import copy
+import asyncio
 import logging
 import os
 import random
@@ -15,8 +15,18 @@ from hahomematic.support import check_or_create_directory
 
 _LOGGER = logging.getLogger(__name__)
 
+_ADDRESS: Final = HmDescription.ADDRESS
+_CHILDREN: Final = HmDescription.CHILDREN
+_PARENT: Final = HmDescription.PARENT
+_TYPE: Final = HmDescription.TYPE
+
 _DEVICE_DESCRIPTIONS_DIR: Final = "export_device_descriptions"
+# The exported files are meant to be read by humans, so keep them indented.
+_ORJSON_OPTIONS: Final = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
 _PARAMSET_DESCRIPTIONS_DIR: Final = "export_paramset_descriptions"
+_RANDOM: Final = random.Random()
+# Directories, that have already been checked / created by an export.
+_VERIFIED_DIRECTORIES: Final[set[str]] = set()
 
 
 class DeviceExporter:
@@ -29,7 +39,7 @@ class DeviceExporter:
         self._storage_folder: Final = self._central.config.storage_folder
         self._interface_id: Final = interface_id
         self._device_address: Final = device_address
-        self._random_id: Final[str] = "VCU%i" % random.randint(1000000, 9999999)
+        self._random_id: Final[str] = f"VCU{_RANDOM.randrange(1000000, 10000000)}"
 
     async def export_data(self) -> None:
         """Export data."""
@@ -41,7 +51,7 @@ class DeviceExporter:
         paramset_descriptions: dict[str, Any] = await self._client.get_all_paramset_descriptions(
             list(device_descriptions.values())
         )
-        device_type = device_descriptions[self._device_address][HmDescription.TYPE]
+        device_type = device_descriptions[self._device_address][_TYPE]
         filename = f"{device_type}.json"
 
         # anonymize device_descriptions
@@ -49,18 +59,14 @@ class DeviceExporter:
         for device_description in device_descriptions.values():
             if device_description == {}:
                 continue  # pragma: no cover
-            new_device_description = copy(device_description)
-            new_device_description[HmDescription.ADDRESS] = self._anonymize_address(
-                address=new_device_description[HmDescription.ADDRESS]
-            )
-            if new_device_description.get(HmDescription.PARENT):
-                new_device_description[HmDescription.PARENT] = new_device_description[
-                    HmDescription.ADDRESS
-                ].split(":")[0]
-            elif new_device_description.get(HmDescription.CHILDREN):
-                new_device_description[HmDescription.CHILDREN] = [
-                    self._anonymize_address(a)
-                    for a in new_device_description[HmDescription.CHILDREN]
+            new_device_description = device_description.copy()
+            address = self._anonymize_address(address=new_device_description[_ADDRESS])
+            new_device_description[_ADDRESS] = address
+            if new_device_description.get(_PARENT):
+                new_device_description[_PARENT] = self._random_id
+            elif new_device_description.get(_CHILDREN):
+                new_device_description[_CHILDREN] = [
+                    self._anonymize_address(a) for a in new_device_description[_CHILDREN]
                 ]
             anonymize_device_descriptions.append(new_device_description)
 
@@ -71,38 +77,44 @@ class DeviceExporter:
                 self._anonymize_address(address=address)
             ] = paramset_description
 
-        # Save device_descriptions for device to file.
-        await self._save(
-            file_dir=f"{self._storage_folder}/{_DEVICE_DESCRIPTIONS_DIR}",
-            filename=filename,
-            data=anonymize_device_descriptions,
-        )
-
-        # Save device_descriptions for device to file.
-        await self._save(
-            file_dir=f"{self._storage_folder}/{_PARAMSET_DESCRIPTIONS_DIR}",
-            filename=filename,
-            data=anonymize_paramset_descriptions,
+        # Save device_descriptions and paramset_descriptions for device to file.
+        await asyncio.gather(
+            self._save(
+                file_dir=f"{self._storage_folder}/{_DEVICE_DESCRIPTIONS_DIR}",
+                filename=filename,
+                data=anonymize_device_descriptions,
+            ),
+            self._save(
+                file_dir=f"{self._storage_folder}/{_PARAMSET_DESCRIPTIONS_DIR}",
+                filename=filename,
+                data=anonymize_paramset_descriptions,
+            ),
         )
 
     def _anonymize_address(self, address: str) -> str:
-        address_parts = address.split(":")
-        address_parts[0] = self._random_id
-        return ":".join(address_parts)
+        _, sep, channel_no = address.partition(":")
+        return f"{self._random_id}{sep}{channel_no}"
 
     async def _save(self, file_dir: str, filename: str, data: Any) -> HmDataOperationResult:
         """Save file to disk."""
+        # Serializing is fast, only the file access is done in the executor.
+        payload = orjson.dumps(data, option=_ORJSON_OPTIONS)
 
         def _save() -> HmDataOperationResult:
-            if not check_or_create_directory(file_dir):
-                return HmDataOperationResult.NO_SAVE  # pragma: no cover
-            with open(
-                file=os.path.join(file_dir, filename),
-                mode="wb",
-            ) as fptr:
-                fptr.write(
-                    orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
-                )
+            if file_dir not in _VERIFIED_DIRECTORIES:
+                if not check_or_create_directory(file_dir):
+                    return HmDataOperationResult.NO_SAVE  # pragma: no cover
+                _VERIFIED_DIRECTORIES.add(file_dir)
+            try:
+                with open(
+                    file=os.path.join(file_dir, filename),
+                    mode="wb",
+                ) as fptr:
+                    fptr.write(payload)
+            except FileNotFoundError:  # pragma: no cover
+                # The directory has been removed. Verify it again on the next save.
+                _VERIFIED_DIRECTORIES.discard(file_dir)
+                raise
             return HmDataOperationResult.SAVE_SUCCESS
 
         return await self._central.async_add_executor_job(_save)
@@ -1,14 +1,17 @@
 """Implementation of an async json-rpc client."""
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import cache
 from json import JSONDecodeError
 import logging
-import os
 from pathlib import Path
 import re
 from ssl import SSLError
-from typing import Any, Final
+from sys import intern
+import time
+from typing import Any, Final, cast
 
 from aiohttp import (
     ClientConnectorCertificateError,
@@ -16,6 +19,7 @@ from aiohttp import (
     ClientError,
     ClientResponse,
     ClientSession,
+    TCPConnector,
 )
 import orjson
 
@@ -38,8 +42,21 @@ from hahomematic.support import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_BACKEND_INFO_MAX_AGE: Final = 3600
 _MAX_JSON_SESSION_AGE: Final = 90
+_CONNECTION_LIMIT_PER_HOST: Final = 8
+_KEEPALIVE_TIMEOUT: Final = 60
 
+# The static parts of the JSON-RPC envelope and the request headers.
+# Content-Length is calculated by aiohttp from the payload bytes.
+_HEADERS: Final = {"Content-Type": "application/json"}
+_PAYLOAD_HEAD: Final = b'{"method":'
+_PAYLOAD_PARAMS: Final = b',"params":'
+_PAYLOAD_TAIL: Final = b',"jsonrpc":"1.1","id":0}'
+
+_HTML_TAG_PATTERN: Final = re.compile(r"<.*?>|&(?:[a-z0-9]+|#[0-9]{1,6}|#x[0-9a-f]{1,6});")
+
+_BOOL_VALUES: Final = ("true", "false")
 _HASEXTMARKER: Final = "hasExtMarker"
 _ID: Final = "id"
 _ISACTIVE: Final = "isActive"
@@ -57,9 +74,28 @@ _UNIT: Final = "unit"
 _VALUE: Final = "value"
 _VALUE_LIST: Final = "valueList"
 
+_METHOD_CCU_GET_AUTH_ENABLED: Final = "CCU.getAuthEnabled"
+_METHOD_CCU_GET_HTTPS_REDIRECT_ENABLED: Final = "CCU.getHttpsRedirectEnabled"
+_METHOD_DEVICE_LIST_ALL_DETAIL: Final = "Device.listAllDetail"
+_METHOD_INTERFACE_LIST_INTERFACES: Final = "Interface.listInterfaces"
+_METHOD_PROGRAM_EXECUTE: Final = "Program.execute"
+_METHOD_PROGRAM_GET_ALL: Final = "Program.getAll"
+_METHOD_REGA_RUN_SCRIPT: Final = "ReGa.runScript"
+_METHOD_ROOM_GET_ALL: Final = "Room.getAll"
+_METHOD_SESSION_LOGIN: Final = "Session.login"
+_METHOD_SESSION_LOGOUT: Final = "Session.logout"
+_METHOD_SESSION_RENEW: Final = "Session.renew"
+_METHOD_SUBSECTION_GET_ALL: Final = "Subsection.getAll"
+_METHOD_SYSVAR_DELETE_SYSVAR_BY_NAME: Final = "SysVar.deleteSysVarByName"
+_METHOD_SYSVAR_GET_ALL: Final = "SysVar.getAll"
+_METHOD_SYSVAR_GET_VALUE_BY_NAME: Final = "SysVar.getValueByName"
+_METHOD_SYSVAR_SET_BOOL: Final = "SysVar.setBool"
+_METHOD_SYSVAR_SET_FLOAT: Final = "SysVar.setFloat"
+
 _REGA_SCRIPT_FETCH_ALL_DEVICE_DATA: Final = "fetch_all_device_data.fn"
 _REGA_SCRIPT_GET_SERIAL: Final = "get_serial.fn"
 _REGA_SCRIPT_PATH: Final = "rega_scripts"
+_REGA_SCRIPT_DIR: Final = Path(__file__).resolve().parent / _REGA_SCRIPT_PATH
 _REGA_SCRIPT_SET_SYSTEM_VARIABLE: Final = "set_system_variable.fn"
 _REGA_SCRIPT_SYSTEM_VARIABLES_EXT_MARKER: Final = "get_system_variables_ext_marker.fn"
 
@@ -78,16 +114,46 @@ class JsonRpcAioHttpClient:
         verify_tls: bool = False,
     ) -> None:
         """Session setup."""
-        self._client_session: Final = client_session
+        self._client_session: ClientSession | None = client_session
+        self._owns_client_session: Final = client_session is None
         self._connection_state: Final = connection_state
         self._username: Final = username
         self._password: Final = password
+        self._login_params: Final = {
+            CONF_USERNAME: username,
+            CONF_PASSWORD: password,
+        }
         self._tls: Final = tls
         self._tls_context: Final = get_tls_context(verify_tls) if tls else None
         self._url: Final = f"{device_url}{PATH_JSON_RPC}"
         self._script_cache: Final[dict[str, str]] = {}
-        self._last_session_id_refresh: datetime | None = None
+        self._last_session_id_refresh: float | None = None
         self._session_id: str | None = None
+        self._login_task: asyncio.Task[bool] | None = None
+        self._logout_tasks: Final[set[asyncio.Task[None]]] = set()
+        self._backend_info: Final[dict[str, tuple[float, Any]]] = {}
+        self._backend_info_locks: Final[dict[str, asyncio.Lock]] = {}
+
+    def _get_client_session(self) -> ClientSession:
+        """Return the client session. Create an own session, if none has been provided."""
+        if self._client_session is None or (
+            self._owns_client_session and self._client_session.closed
+        ):
+            self._client_session = ClientSession(
+                connector=TCPConnector(
+                    limit_per_host=_CONNECTION_LIMIT_PER_HOST,
+                    keepalive_timeout=_KEEPALIVE_TIMEOUT,
+                    ssl=self._tls_context if self._tls_context else True,
+                )
+            )
+        return self._client_session
+
+    async def close(self) -> None:
+        """Close the client session, if it has been created by this client."""
+        if self._logout_tasks:
+            await asyncio.gather(*self._logout_tasks, return_exceptions=True)
+        if self._owns_client_session and self._client_session and not self._client_session.closed:
+            await self._client_session.close()
 
     @property
     def is_activated(self) -> bool:
@@ -95,10 +161,23 @@ class JsonRpcAioHttpClient:
         return self._session_id is not None
 
     async def _login_or_renew(self) -> bool:
+        """Renew JSON-RPC session or perform login. Concurrent callers share one request."""
+        if self.is_activated and self._updated_within_seconds():
+            return True
+        if self._login_task is None or self._login_task.done():
+            self._login_task = asyncio.create_task(self._do_login_or_renew())
+        # The task stores the session id itself. Shielding it keeps a cancelled caller
+        # from cancelling the login, so the session id of the backend is not lost.
+        return await asyncio.shield(self._login_task)
+
+    async def _do_login_or_renew(self) -> bool:
         """Renew JSON-RPC session or perform login."""
+        # A previous login task might have refreshed the session in the meantime.
+        if self.is_activated and self._updated_within_seconds():
+            return True
         if not self.is_activated:
             self._session_id = await self._do_login()
-            self._last_session_id_refresh = datetime.now()
+            self._last_session_id_refresh = time.monotonic()
             return self._session_id is not None
         if self._session_id:
             self._session_id = await self._do_renew_login(self._session_id)
@@ -108,7 +187,7 @@ class JsonRpcAioHttpClient:
         """Renew JSON-RPC session or perform login."""
         if self._updated_within_seconds():
             return session_id
-        method = "Session.renew"
+        method = _METHOD_SESSION_RENEW
         response = await self._do_post(
             session_id=session_id,
             method=method,
@@ -116,7 +195,7 @@ class JsonRpcAioHttpClient:
         )
 
         if response[_P_RESULT] and response[_P_RESULT] is True:
-            self._last_session_id_refresh = datetime.now()
+            self._last_session_id_refresh = time.monotonic()
             _LOGGER.debug("DO_RENEW_LOGIN: Method: %s [%s]", method, session_id)
             return session_id
 
@@ -124,12 +203,10 @@ class JsonRpcAioHttpClient:
 
     def _updated_within_seconds(self, max_age_seconds: int = _MAX_JSON_SESSION_AGE) -> bool:
         """Check if session id has been updated within 90 seconds."""
-        if self._last_session_id_refresh is None:
-            return False
-        delta = datetime.now() - self._last_session_id_refresh
-        if delta.seconds < max_age_seconds:
-            return True
-        return False
+        return (
+            self._last_session_id_refresh is not None
+            and (time.monotonic() - self._last_session_id_refresh) < max_age_seconds
+        )
 
     async def _do_login(self) -> str | None:
         """Login to CCU and return session."""
@@ -139,15 +216,11 @@ class JsonRpcAioHttpClient:
 
         session_id: str | None = None
 
-        params = {
-            CONF_USERNAME: self._username,
-            CONF_PASSWORD: self._password,
-        }
-        method = "Session.login"
+        method = _METHOD_SESSION_LOGIN
         response = await self._do_post(
             session_id=False,
             method=method,
-            extra_params=params,
+            extra_params=self._login_params,
             use_default_params=False,
         )
 
@@ -188,7 +261,7 @@ class JsonRpcAioHttpClient:
             _LOGGER.debug("POST method: %s", method)
 
         if not keep_session:
-            await self._do_logout(session_id=session_id)
+            self._create_logout_task(session_id=session_id)
 
         return response
 
@@ -212,10 +285,12 @@ class JsonRpcAioHttpClient:
             raise ClientException(f"Script file for {script_name} does not exist")
 
         if extra_params:
-            for variable, value in extra_params.items():
-                script = script.replace(f"##{variable}##", value)
+            variables: dict[str, str] = extra_params
+            script = _get_script_variable_pattern(variables=frozenset(variables)).sub(
+                lambda match: variables[match.group(1)], script
+            )
 
-        method = "ReGa.runScript"
+        method = _METHOD_REGA_RUN_SCRIPT
         response = await self._do_post(
             session_id=session_id,
             method=method,
@@ -223,21 +298,26 @@ class JsonRpcAioHttpClient:
         )
 
         if not response[_P_ERROR]:
+            # The script output is a JSON string within the JSON-RPC envelope.
+            # Replacing it in place releases the string as soon as it has been parsed.
             response[_P_RESULT] = orjson.loads(response[_P_RESULT])
         _LOGGER.debug("POST_SCRIPT: Method: %s [%s]", method, script_name)
 
         if not keep_session:
-            await self._do_logout(session_id=session_id)
+            self._create_logout_task(session_id=session_id)
 
         return response
 
     def _get_script(self, script_name: str) -> str | None:
         """Return a script from the script cache. Load if required."""
-        if script_name in self._script_cache:
-            return self._script_cache[script_name]
+        if (script := self._script_cache.get(script_name)) is not None:
+            return script
 
-        script_file = os.path.join(Path(__file__).resolve().parent, _REGA_SCRIPT_PATH, script_name)
-        if script := Path(script_file).read_text(encoding=DEFAULT_ENCODING):
+        try:
+            script = (_REGA_SCRIPT_DIR / script_name).read_text(encoding=DEFAULT_ENCODING)
+        except FileNotFoundError:
+            return None
+        if script:
             self._script_cache[script_name] = script
             return script
         return None
@@ -250,32 +330,35 @@ class JsonRpcAioHttpClient:
         use_default_params: bool = True,
     ) -> dict[str, Any] | Any:
         """Reusable JSON-RPC POST function."""
-        if not self._client_session:
-            raise ClientException("ClientSession not initialized")
         if not self._has_credentials:
             raise ClientException("No credentials set")
 
         params = _get_params(session_id, extra_params, use_default_params)
 
         try:
-            payload = orjson.dumps({"method": method, "params": params, "jsonrpc": "1.1", "id": 0})
-
-            headers = {
-                "Content-Type": "application/json",
-                "Content-Length": str(len(payload)),
-            }
+            client_session = self._get_client_session()
+            payload = b"".join(
+                (
+                    _PAYLOAD_HEAD,
+                    orjson.dumps(method),
+                    _PAYLOAD_PARAMS,
+                    orjson.dumps(params),
+                    _PAYLOAD_TAIL,
+                )
+            )
 
-            if self._tls:
-                response = await self._client_session.post(
+            # An own session already holds the tls context in its connector.
+            if self._tls and not self._owns_client_session:
+                response = await client_session.post(
                     self._url,
                     data=payload,
-                    headers=headers,
+                    headers=_HEADERS,
                     timeout=config.TIMEOUT,
                     ssl=self._tls_context,
                 )
             else:
-                response = await self._client_session.post(
-                    self._url, data=payload, headers=headers, timeout=config.TIMEOUT
+                response = await client_session.post(
+                    self._url, data=payload, headers=_HEADERS, timeout=config.TIMEOUT
                 )
             if response.status == 200:
                 self._connection_state.remove_issue(issuer=self)
@@ -322,15 +405,16 @@ class JsonRpcAioHttpClient:
 
     async def _get_json_reponse(self, response: ClientResponse) -> dict[str, Any] | Any:
         """Return the json object from response."""
+        body = await response.read()
         try:
-            return await response.json(encoding="utf-8")
-        except ValueError as ver:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as jderr:
             _LOGGER.debug(
-                "DO_POST: ValueError [%s] Unable to parse JSON. Trying workaround",
-                reduce_args(args=ver.args),
+                "DO_POST: JSONDecodeError [%s] Unable to parse JSON. Trying workaround",
+                reduce_args(args=jderr.args),
             )
             # Workaround for bug in CCU
-            return orjson.loads((await response.json(encoding="utf-8")).replace("\\", ""))
+            return orjson.loads(body.replace(b"\\", b""))
 
     async def logout(self) -> None:
         """Logout of CCU."""
@@ -340,13 +424,26 @@ class JsonRpcAioHttpClient:
             self._handle_exception_log(method="LOGOUT", exception=clex)
             return
 
+    def _create_logout_task(self, session_id: str) -> None:
+        """Logout of a temporary session without blocking the caller."""
+        task = asyncio.create_task(self._do_background_logout(session_id=session_id))
+        self._logout_tasks.add(task)
+        task.add_done_callback(self._logout_tasks.discard)
+
+    async def _do_background_logout(self, session_id: str) -> None:
+        """Logout of a temporary session."""
+        try:
+            await self._do_logout(session_id=session_id)
+        except ClientException as clex:
+            self._handle_exception_log(method="LOGOUT", exception=clex)
+
     async def _do_logout(self, session_id: str | None) -> None:
         """Logout of CCU."""
         if not session_id:
             _LOGGER.debug("DO_LOGOUT: Not logged in. Not logging out.")
             return
 
-        method = "Session.logout"
+        method = _METHOD_SESSION_LOGOUT
         params = {_SESSION_ID: session_id}
         try:
             await self._do_post(
@@ -356,7 +453,9 @@ class JsonRpcAioHttpClient:
             )
             _LOGGER.debug("DO_LOGOUT: Method: %s [%s]", method, session_id)
         finally:
-            self.clear_session()
+            # Logging out of a temporary session must not clear the kept session.
+            if session_id == self._session_id:
+                self.clear_session()
 
     @property
     def _has_credentials(self) -> bool:
@@ -369,7 +468,7 @@ class JsonRpcAioHttpClient:
             _ID: pid,
         }
         try:
-            response = await self._post("Program.execute", params)
+            response = await self._post(_METHOD_PROGRAM_EXECUTE, params)
             _LOGGER.debug("EXECUTE_PROGRAM: Executing a program")
 
             if json_result := response[_P_RESULT]:
@@ -393,9 +492,9 @@ class JsonRpcAioHttpClient:
         try:
             if isinstance(value, bool):
                 params[_VALUE] = int(value)
-                response = await self._post("SysVar.setBool", params)
+                response = await self._post(_METHOD_SYSVAR_SET_BOOL, params)
             elif isinstance(value, str):
-                if re.findall("<.*?>|&([a-z0-9]+|#[0-9]{1,6}|#x[0-9a-f]{1,6});", value):
+                if _HTML_TAG_PATTERN.search(value):
                     _LOGGER.warning(
                         "SET_SYSTEM_VARIABLE failed: "
                         "Value (%s) contains html tags. This is not allowed",
@@ -406,7 +505,7 @@ class JsonRpcAioHttpClient:
                     script_name=_REGA_SCRIPT_SET_SYSTEM_VARIABLE, extra_params=params
                 )
             else:
-                response = await self._post("SysVar.setFloat", params)
+                response = await self._post(_METHOD_SYSVAR_SET_FLOAT, params)
 
             _LOGGER.debug("SET_SYSTEM_VARIABLE: Setting System variable")
             if json_result := response[_P_RESULT]:
@@ -423,13 +522,18 @@ class JsonRpcAioHttpClient:
     def clear_session(self) -> None:
         """Clear the current session."""
         self._session_id = None
+        self.clear_backend_info()
+
+    def clear_backend_info(self) -> None:
+        """Clear the cached backend information."""
+        self._backend_info.clear()
 
     async def delete_system_variable(self, name: str) -> bool:
         """Delete a system variable from CCU / Homegear."""
         params = {_NAME: name}
         try:
             response = await self._post(
-                "SysVar.deleteSysVarByName",
+                _METHOD_SYSVAR_DELETE_SYSVAR_BY_NAME,
                 params,
             )
 
@@ -450,17 +554,20 @@ class JsonRpcAioHttpClient:
         try:
             params = {_NAME: name}
             response = await self._post(
-                "SysVar.getValueByName",
+                _METHOD_SYSVAR_GET_VALUE_BY_NAME,
                 params,
             )
 
             _LOGGER.debug("GET_SYSTEM_VARIABLE: Getting System variable")
             if json_result := response[_P_RESULT]:
                 # This does not yet support strings
-                try:
-                    var = float(json_result)
-                except Exception:
+                if json_result in _BOOL_VALUES:
                     var = json_result == "true"
+                else:
+                    try:
+                        var = float(json_result)
+                    except (TypeError, ValueError):
+                        var = False
         except ClientException as clex:
             self._handle_exception_log(method="DELETE_SYSTEM_VARIABLE", exception=clex)
             return None
@@ -471,13 +578,16 @@ class JsonRpcAioHttpClient:
         """Get all system variables from CCU / Homegear."""
         variables: list[SystemVariableData] = []
         try:
-            response = await self._post(
-                "SysVar.getAll",
+            # The ext markers are fetched concurrently to save one round trip.
+            response, ext_markers = await asyncio.gather(
+                self._post(
+                    _METHOD_SYSVAR_GET_ALL,
+                ),
+                self._get_system_variables_ext_markers(),
             )
 
             _LOGGER.debug("GET_ALL_SYSTEM_VARIABLES: Getting all system variables")
             if json_result := response[_P_RESULT]:
-                ext_markers = await self._get_system_variables_ext_markers()
                 for var in json_result:
                     is_internal = var[_ISINTERNAL]
                     if include_internal is False and is_internal is True:
@@ -555,19 +665,16 @@ class JsonRpcAioHttpClient:
 
         try:
             response = await self._post(
-                "Room.getAll",
+                _METHOD_ROOM_GET_ALL,
             )
 
             _LOGGER.debug("GET_ALL_CHANNEL_IDS_PER_ROOM: Getting all rooms")
             if json_result := response[_P_RESULT]:
                 for room in json_result:
-                    if room["id"] not in channel_ids_room:
-                        channel_ids_room[room["id"]] = set()
-                    channel_ids_room[room["id"]].add(room["name"])
+                    room_name = room["name"]
+                    channel_ids_room.setdefault(room["id"], set()).add(room_name)
                     for channel_id in room["channelIds"]:
-                        if channel_id not in channel_ids_room:
-                            channel_ids_room[channel_id] = set()
-                        channel_ids_room[channel_id].add(room["name"])
+                        channel_ids_room.setdefault(channel_id, set()).add(room_name)
         except ClientException as clex:
             self._handle_exception_log(method="GET_ALL_CHANNEL_IDS_PER_ROOM", exception=clex)
             return {}
@@ -580,19 +687,16 @@ class JsonRpcAioHttpClient:
 
         try:
             response = await self._post(
-                "Subsection.getAll",
+                _METHOD_SUBSECTION_GET_ALL,
             )
 
             _LOGGER.debug("GET_ALL_CHANNEL_IDS_PER_FUNCTION: Getting all functions")
             if json_result := response[_P_RESULT]:
                 for function in json_result:
-                    if function["id"] not in channel_ids_function:
-                        channel_ids_function[function["id"]] = set()
-                    channel_ids_function[function["id"]].add(function["name"])
+                    function_name = function["name"]
+                    channel_ids_function.setdefault(function["id"], set()).add(function_name)
                     for channel_id in function["channelIds"]:
-                        if channel_id not in channel_ids_function:
-                            channel_ids_function[channel_id] = set()
-                        channel_ids_function[channel_id].add(function["name"])
+                        channel_ids_function.setdefault(channel_id, set()).add(function_name)
         except ClientException as clex:
             self._handle_exception_log(method="GET_ALL_CHANNEL_IDS_PER_FUNCTION", exception=clex)
             return {}
@@ -605,13 +709,12 @@ class JsonRpcAioHttpClient:
 
         try:
             response = await self._post(
-                "Interface.listInterfaces",
+                _METHOD_INTERFACE_LIST_INTERFACES,
             )
 
             _LOGGER.debug("GET_AVAILABLE_INTERFACES: Getting all available interfaces")
             if json_result := response[_P_RESULT]:
-                for interface in json_result:
-                    interfaces.append(interface[_NAME])
+                interfaces = [interface[_NAME] for interface in json_result]
         except ClientException as clex:
             self._handle_exception_log(method="GET_AVAILABLE_INTERFACES", exception=clex)
             return []
@@ -624,7 +727,7 @@ class JsonRpcAioHttpClient:
 
         try:
             response = await self._post(
-                method="Device.listAllDetail",
+                method=_METHOD_DEVICE_LIST_ALL_DETAIL,
             )
 
             _LOGGER.debug("GET_DEVICE_DETAILS: Getting the device details")
@@ -636,9 +739,9 @@ class JsonRpcAioHttpClient:
 
         return device_details
 
-    async def get_all_device_data(self) -> dict[str, dict[str, dict[str, Any]]]:
+    async def get_all_device_data(self) -> dict[tuple[str, str, str], Any]:
         """Get the all device data of the backend."""
-        all_device_data: dict[str, dict[str, dict[str, Any]]] = {}
+        all_device_data: dict[tuple[str, str, str], Any] = {}
 
         try:
             response = await self._post_script(script_name=_REGA_SCRIPT_FETCH_ALL_DEVICE_DATA)
@@ -662,41 +765,60 @@ class JsonRpcAioHttpClient:
 
         try:
             response = await self._post(
-                method="Program.getAll",
+                method=_METHOD_PROGRAM_GET_ALL,
             )
 
             _LOGGER.debug("GET_ALL_PROGRAMS: Getting all programs")
             if json_result := response[_P_RESULT]:
-                for prog in json_result:
-                    is_internal = prog[_ISINTERNAL]
-                    if include_internal is False and is_internal is True:
-                        continue
-                    pid = prog[_ID]
-                    name = prog[_NAME]
-                    is_active = prog[_ISACTIVE]
-                    last_execute_time = prog[_LASTEXECUTETIME]
-
-                    all_programs.append(
-                        ProgramData(
-                            pid=pid,
-                            name=name,
-                            is_active=is_active,
-                            is_internal=is_internal,
-                            last_execute_time=last_execute_time,
-                        )
+                all_programs = [
+                    ProgramData(
+                        pid=prog[_ID],
+                        name=prog[_NAME],
+                        is_active=prog[_ISACTIVE],
+                        is_internal=prog[_ISINTERNAL],
+                        last_execute_time=prog[_LASTEXECUTETIME],
                     )
+                    for prog in json_result
+                    if include_internal is True or prog[_ISINTERNAL] is not True
+                ]
         except ClientException as clex:
             self._handle_exception_log(method="GET_ALL_PROGRAMS", exception=clex)
             return []
 
         return all_programs
 
+    async def _get_backend_info(
+        self, key: str, fetch: Callable[[], Awaitable[Any]], max_age_seconds: float | None
+    ) -> Any:
+        """Return a cached backend information. Fetch it, if missing or outdated."""
+        if (lock := self._backend_info_locks.get(key)) is None:
+            lock = self._backend_info_locks[key] = asyncio.Lock()
+        async with lock:
+            if (entry := self._backend_info.get(key)) is not None and (
+                max_age_seconds is None or (time.monotonic() - entry[0]) < max_age_seconds
+            ):
+                return entry[1]
+            if (value := await fetch()) is not None:
+                self._backend_info[key] = (time.monotonic(), value)
+            return value
+
     async def get_auth_enabled(self) -> bool | None:
+        """Get the auth_enabled flag of the backend."""
+        return cast(
+            bool | None,
+            await self._get_backend_info(
+                key=_METHOD_CCU_GET_AUTH_ENABLED,
+                fetch=self._get_auth_enabled,
+                max_age_seconds=_BACKEND_INFO_MAX_AGE,
+            ),
+        )
+
+    async def _get_auth_enabled(self) -> bool | None:
         """Get the auth_enabled flag of the backend."""
         auth_enabled: bool | None = None
 
         try:
-            response = await self._post(method="CCU.getAuthEnabled")
+            response = await self._post(method=_METHOD_CCU_GET_AUTH_ENABLED)
 
             _LOGGER.debug("GET_AUTH_ENABLED: Getting the flag auth_enabled")
             if (json_result := response[_P_RESULT]) is not None:
@@ -707,11 +829,22 @@ class JsonRpcAioHttpClient:
         return auth_enabled
 
     async def get_https_redirect_enabled(self) -> bool | None:
-        """Get the auth_enabled flag of the backend."""
+        """Get the https_redirect_enabled flag of the backend."""
+        return cast(
+            bool | None,
+            await self._get_backend_info(
+                key=_METHOD_CCU_GET_HTTPS_REDIRECT_ENABLED,
+                fetch=self._get_https_redirect_enabled,
+                max_age_seconds=_BACKEND_INFO_MAX_AGE,
+            ),
+        )
+
+    async def _get_https_redirect_enabled(self) -> bool | None:
+        """Get the https_redirect_enabled flag of the backend."""
         https_redirect_enabled: bool | None = None
 
         try:
-            response = await self._post(method="CCU.getHttpsRedirectEnabled")
+            response = await self._post(method=_METHOD_CCU_GET_HTTPS_REDIRECT_ENABLED)
 
             _LOGGER.debug("GET_HTTPS_REDIRECT_ENABLED: Getting the flag https_redirect_enabled")
             if (json_result := response[_P_RESULT]) is not None:
@@ -724,16 +857,23 @@ class JsonRpcAioHttpClient:
 
     async def get_serial(self) -> str | None:
         """Get the serial of the backend."""
-        serial = "unknown"
+        # The serial of a backend does not change, so it is cached without max age.
+        serial = await self._get_backend_info(
+            key=_REGA_SCRIPT_GET_SERIAL, fetch=self._get_serial, max_age_seconds=None
+        )
+        return "unknown" if serial is None else cast(str, serial)
+
+    async def _get_serial(self) -> str | None:
+        """Get the serial of the backend."""
+        serial: str | None = None
 
         try:
             response = await self._post_script(script_name=_REGA_SCRIPT_GET_SERIAL)
 
             _LOGGER.debug("GET_SERIAL: Getting the backend serial")
             if json_result := response[_P_RESULT]:
-                serial = json_result["serial"]
-                if len(serial) > 10:
-                    serial = serial[-10:]
+                # Only the last 10 characters are used as serial.
+                serial = str(json_result["serial"])[-10:]
         except ClientException as clex:
             self._handle_exception_log(method="GET_SERIAL", exception=clex)
         except JSONDecodeError as jderr:
@@ -766,28 +906,28 @@ def _get_params(
     use_default_params: bool,
 ) -> dict[str, Any]:
     """Add additional params to default prams."""
-    params: dict[str, Any] = {_SESSION_ID: session_id} if use_default_params else {}
-    if extra_params:
-        params.update(extra_params)
-    return params
+    if use_default_params:
+        if extra_params:
+            return {_SESSION_ID: session_id, **extra_params}
+        return {_SESSION_ID: session_id}
+    return extra_params or {}
+
+
+@cache
+def _get_script_variable_pattern(variables: frozenset[str]) -> re.Pattern[str]:
+    """Return a pattern, that matches all ##variable## markers of a script."""
+    return re.compile(f"##({'|'.join(map(re.escape, variables))})##")
 
 
-def _convert_to_values_cache(
-    all_device_data: dict[str, Any]
-) -> dict[str, dict[str, dict[str, Any]]]:
-    """Convert all device data o separated value list."""
-    values_cache: dict[str, dict[str, dict[str, Any]]] = {}
+def _convert_to_values_cache(all_device_data: dict[str, Any]) -> dict[tuple[str, str, str], Any]:
+    """Convert all device data to a values cache keyed by interface, channel_address, parameter."""
+    values_cache: dict[tuple[str, str, str], Any] = {}
     for device_adr, value in all_device_data.items():
-        device_adr = device_adr.replace("%3A", ":")
-        device_adrs = device_adr.split(".")
-        interface = device_adrs[0]
-        if interface not in values_cache:
-            values_cache[interface] = {}
-        channel_address = device_adrs[1]
-        if channel_address not in values_cache[interface]:
-            values_cache[interface][channel_address] = {}
-        parameter = device_adrs[2]
-        if parameter not in values_cache[interface][channel_address]:
-            values_cache[interface][channel_address][parameter] = {}
-        values_cache[interface][channel_address][parameter] = value
+        # The key has the format interface.channel_address.parameter,
+        # only the channel address contains the url encoded colon.
+        interface, channel_address, parameter = device_adr.split(".", 2)
+        # The parts repeat across many rows, so they are interned to share one string object.
+        values_cache[
+            (intern(interface), intern(channel_address.replace("%3A", ":")), intern(parameter))
+        ] = value
     return values_cache
@@ -36,8 +36,8 @@ def _importlibs() -> None:
     """
     Ensure that all platforms are loaded.
 
-    This ensures that the platform.DEVICES are loaded into ALL_DEVICES,
-    and platform.BLACKLISTED_DEVICES are loaded into ALL_BLACKLISTED_DEVICES.
+    This ensures that the platform.DEVICES are registered in ALL_DEVICES,
+    and platform.BLACKLISTED_DEVICES in ALL_BLACKLISTED_DEVICES.
     """
     importlib.import_module("hahomematic.platforms.custom.climate")
     importlib.import_module("hahomematic.platforms.custom.cover")
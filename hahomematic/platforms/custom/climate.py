@@ -679,6 +679,5 @@ DEVICES: dict[str, CustomConfig | tuple[CustomConfig, ...]] = {
     "Thermostat AA": CustomConfig(func=make_ip_thermostat, channels=(1,)),
     "ZEL STG RM FWT": CustomConfig(func=make_simple_thermostat, channels=(1,)),
 }
-hmed.ALL_DEVICES.append(DEVICES)
 BLACKLISTED_DEVICES: tuple[str, ...] = ("HmIP-STHO",)
-hmed.ALL_BLACKLISTED_DEVICES.append(BLACKLISTED_DEVICES)
+hmed.register_devices(devices=DEVICES, blacklisted_devices=BLACKLISTED_DEVICES)
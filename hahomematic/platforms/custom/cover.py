@@ -648,4 +648,4 @@ DEVICES: dict[str, CustomConfig | tuple[CustomConfig, ...]] = {
     ),
     "ZEL STG RM FEP 230V": CustomConfig(func=make_rf_cover, channels=(1,)),
 }
-hmed.ALL_DEVICES.append(DEVICES)
+hmed.register_devices(devices=DEVICES)
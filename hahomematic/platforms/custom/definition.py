@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from functools import cache
 import logging
 from typing import Any, Final, cast
 
@@ -700,10 +701,34 @@ def _get_device_entities(
     return new_entities
 
 
+def register_devices(
+    devices: dict[str, CustomConfig | tuple[CustomConfig, ...]],
+    blacklisted_devices: tuple[str, ...] = (),
+) -> None:
+    """Register the custom entity configs and blacklisted devices of a platform."""
+    ALL_DEVICES.append(devices)
+    if blacklisted_devices:
+        ALL_BLACKLISTED_DEVICES.append(blacklisted_devices)
+    _get_entity_configs.cache_clear()
+
+
 def get_entity_configs(
     device_type: str,
 ) -> list[CustomConfig | tuple[CustomConfig, ...]]:
     """Return the entity configs to create custom entities."""
+    return list(_get_entity_configs(device_type=device_type))
+
+
+@cache
+def _get_entity_configs(
+    device_type: str,
+) -> tuple[CustomConfig | tuple[CustomConfig, ...], ...]:
+    """
+    Return the cached entity configs to create custom entities.
+
+    The result is requested several times for every device.
+    register_devices clears the cache, when ALL_DEVICES is extended.
+    """
     device_type = device_type.lower().replace("hb-", "hm-")
     funcs = []
     for platform_blacklisted_devices in ALL_BLACKLISTED_DEVICES:
@@ -711,7 +736,7 @@ def get_entity_configs(
             search_elements=platform_blacklisted_devices,
             compare_with=device_type,
         ):
-            return []
+            return ()
 
     for platform_devices in ALL_DEVICES:
         if func := _get_entity_config_by_platform(
@@ -719,7 +744,7 @@ def get_entity_configs(
             device_type=device_type,
         ):
             funcs.append(func)
-    return funcs
+    return tuple(funcs)
 
 
 def _get_entity_config_by_platform(
@@ -727,12 +752,13 @@ def _get_entity_config_by_platform(
     device_type: str,
 ) -> CustomConfig | tuple[CustomConfig, ...] | None:
     """Return the entity configs to create custom entities."""
+    # The device_type has already been lowered by get_entity_configs.
     for d_type, custom_configs in platform_devices.items():
-        if device_type.lower() == d_type.lower():
+        if device_type == d_type.lower():
             return custom_configs
 
     for d_type, custom_configs in platform_devices.items():
-        if device_type.lower().startswith(d_type.lower()):
+        if device_type.startswith(d_type.lower()):
             return custom_configs
 
     return None
@@ -741,7 +767,7 @@ def _get_entity_config_by_platform(
 def is_multi_channel_device(device_type: str) -> bool:
     """Return true, if device has multiple channels."""
     channels: list[int] = []
-    for entity_configs in get_entity_configs(device_type=device_type):
+    for entity_configs in _get_entity_configs(device_type=device_type):
         if isinstance(entity_configs, CustomConfig):
             channels.extend(entity_configs.channels)
         else:
@@ -753,7 +779,7 @@ def is_multi_channel_device(device_type: str) -> bool:
 
 def entity_definition_exists(device_type: str) -> bool:
     """Check if device desc exits."""
-    return len(get_entity_configs(device_type)) > 0
+    return len(_get_entity_configs(device_type=device_type)) > 0
 
 
 def get_required_parameters() -> tuple[str, ...]:
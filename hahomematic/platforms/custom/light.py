@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import math
-from typing import Any, Final, TypedDict
+from typing import Any, Final, TypedDict, cast
 
 from hahomematic.const import (
     HM_ARG_OFF,
@@ -46,6 +46,7 @@ from hahomematic.platforms.custom.entity import CustomEntity
 from hahomematic.platforms.custom.support import CustomConfig, ExtendedConfig
 from hahomematic.platforms.entity import CallParameterCollector
 from hahomematic.platforms.generic.action import HmAction
+from hahomematic.platforms.generic.entity import GenericEntity
 from hahomematic.platforms.generic.number import HmFloat, HmInteger
 from hahomematic.platforms.generic.select import HmSelect
 from hahomematic.platforms.generic.sensor import HmSensor
@@ -69,12 +70,21 @@ _HM_EFFECT_OFF: Final = "Off"
 
 _HM_MAX_MIREDS: Final = 500
 _HM_MIN_MIREDS: Final = 153
+_HM_MIRED_RANGE: Final = _HM_MAX_MIREDS - _HM_MIN_MIREDS
+# Half of the smallest step HA can request. Smaller differences are rounding noise
+# between the HA scale and the device scale, not a change.
+_COLOR_LEVEL_TOLERANCE: Final = 0.5 / _HM_MIRED_RANGE
+_SATURATION_TOLERANCE: Final = 0.5 / 100
+# Conversions between mireds and kelvin are rounded like in Home Assistant core.
+_MIRED_KELVIN_FACTOR: Final = 1_000_000
 
 _HM_DIMMER_OFF: Final = 0.0
 
 _TIME_UNIT_SECONDS: Final = 0
 _TIME_UNIT_MINUTES: Final = 1
 _TIME_UNIT_HOURS: Final = 2
+# Max. timer value, that can be sent in one unit.
+_TIMER_MAX_VALUE: Final = 16343
 
 _COLOR_BEHAVIOUR_DO_NOT_CARE: Final = "DO_NOT_CARE"
 _COLOR_BEHAVIOUR_OFF: Final = "OFF"
@@ -92,22 +102,46 @@ _COLOR_TURQUOISE: Final = "TURQUOISE"
 _COLOR_WHITE: Final = "WHITE"
 _COLOR_YELLOW: Final = "YELLOW"
 
-_NO_COLOR: Final = (
-    _COLOR_BLACK,
-    _COLOR_DO_NOT_CARE,
-    _COLOR_OLD_VALUE,
+_HUE_COLORS: Final = (
+    _COLOR_YELLOW,
+    _COLOR_GREEN,
+    _COLOR_TURQUOISE,
+    _COLOR_BLUE,
+    _COLOR_PURPLE,
 )
 
-_EXCLUDE_FROM_COLOR_BEHAVIOUR: Final = (
-    _COLOR_BEHAVIOUR_DO_NOT_CARE,
-    _COLOR_BEHAVIOUR_OFF,
-    _COLOR_BEHAVIOUR_OLD_VALUE,
+_COLOR_SWITCHER: Final[dict[str, tuple[float, float]]] = {
+    _COLOR_WHITE: (0.0, 0.0),
+    _COLOR_RED: (0.0, 100.0),
+    _COLOR_YELLOW: (60.0, 100.0),
+    _COLOR_GREEN: (120.0, 100.0),
+    _COLOR_TURQUOISE: (180.0, 100.0),
+    _COLOR_BLUE: (240.0, 100.0),
+    _COLOR_PURPLE: (300.0, 100.0),
+}
+
+_NO_COLOR: Final[frozenset[str]] = frozenset(
+    (
+        _COLOR_BLACK,
+        _COLOR_DO_NOT_CARE,
+        _COLOR_OLD_VALUE,
+    )
 )
 
-_OFF_COLOR_BEHAVIOUR: Final = (
-    _COLOR_BEHAVIOUR_DO_NOT_CARE,
-    _COLOR_BEHAVIOUR_OFF,
-    _COLOR_BEHAVIOUR_OLD_VALUE,
+_EXCLUDE_FROM_COLOR_BEHAVIOUR: Final[frozenset[str]] = frozenset(
+    (
+        _COLOR_BEHAVIOUR_DO_NOT_CARE,
+        _COLOR_BEHAVIOUR_OFF,
+        _COLOR_BEHAVIOUR_OLD_VALUE,
+    )
+)
+
+_OFF_COLOR_BEHAVIOUR: Final[frozenset[str]] = frozenset(
+    (
+        _COLOR_BEHAVIOUR_DO_NOT_CARE,
+        _COLOR_BEHAVIOUR_OFF,
+        _COLOR_BEHAVIOUR_OLD_VALUE,
+    )
 )
 
 
@@ -127,6 +161,9 @@ class BaseHmLight(CustomEntity, OnTimeMixin):
     """Base class for HomeMatic light entities."""
 
     _attr_platform = HmPlatform.LIGHT
+    _attr_supports_color_temperature: bool = False
+    _attr_supports_effects: bool = False
+    _attr_supports_hs_color: bool = False
 
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
@@ -139,6 +176,8 @@ class BaseHmLight(CustomEntity, OnTimeMixin):
         self._e_ramp_time_value: HmAction = self._get_entity(
             field_name=FIELD_RAMP_TIME_VALUE, entity_type=HmAction
         )
+        self._attr_supports_brightness: bool = isinstance(self._e_level, HmFloat)
+        self._attr_supports_transition: bool = isinstance(self._e_ramp_time_value, HmAction)
 
     @value_property
     @abstractmethod
@@ -163,27 +202,27 @@ class BaseHmLight(CustomEntity, OnTimeMixin):
     @config_property
     def supports_brightness(self) -> bool:
         """Flag if light supports brightness."""
-        return isinstance(self._e_level, HmFloat)
+        return self._attr_supports_brightness
 
     @config_property
     def supports_color_temperature(self) -> bool:
         """Flag if light supports color temperature."""
-        return False
+        return self._attr_supports_color_temperature
 
     @config_property
     def supports_effects(self) -> bool:
         """Flag if light supports effects."""
-        return False
+        return self._attr_supports_effects
 
     @config_property
     def supports_hs_color(self) -> bool:
         """Flag if light supports color."""
-        return False
+        return self._attr_supports_hs_color
 
     @config_property
     def supports_transition(self) -> bool:
         """Flag if light supports transition."""
-        return isinstance(self._e_ramp_time_value, HmAction)
+        return self._attr_supports_transition
 
     @value_property
     def effect(self) -> str | None:
@@ -204,12 +243,24 @@ class BaseHmLight(CustomEntity, OnTimeMixin):
         """Turn the light on."""
         if not self.is_state_change(on=True, **kwargs):
             return
-        if ramp_time := kwargs.get(_HM_ARG_RAMP_TIME):
+        await self._turn_on_impl(collector=collector, args=cast(HmLightArgs, kwargs))
+
+    async def _turn_on_impl(
+        self, collector: CallParameterCollector | None, args: HmLightArgs
+    ) -> None:
+        """
+        Turn the light on with the already checked arguments.
+
+        Subclasses extend this instead of turn_on, so that the arguments dict is shared
+        along the class hierarchy and the state change is only checked once.
+        """
+        if ramp_time := args.get(_HM_ARG_RAMP_TIME):
             await self._set_ramp_time_on_value(ramp_time=float(ramp_time), collector=collector)
-        if (on_time := kwargs.get(HM_ARG_ON_TIME)) or (on_time := self.get_on_time_and_cleanup()):
+        if (on_time := args.get(HM_ARG_ON_TIME)) or (on_time := self.get_on_time_and_cleanup()):
             await self._set_on_time_value(on_time=on_time, collector=collector)
 
-        brightness = kwargs.get(_HM_ARG_BRIGHTNESS, self.brightness)
+        # The current brightness is only read, if no brightness has been passed.
+        brightness = args[_HM_ARG_BRIGHTNESS] if _HM_ARG_BRIGHTNESS in args else self.brightness
         if not brightness:
             brightness = 255
         level = brightness / 255.0
@@ -248,9 +299,16 @@ class BaseHmLight(CustomEntity, OnTimeMixin):
 
     def is_state_change(self, **kwargs: Any) -> bool:
         """Check if the state changes due to kwargs."""
-        if kwargs.get(HM_ARG_ON) is not None and self.is_on is not True and len(kwargs) == 1:
+        if len(kwargs) == 1:
+            if kwargs.get(HM_ARG_ON) is not None and self.is_on is not True:
+                return True
+            if kwargs.get(HM_ARG_OFF) is not None and self.is_on is not False:
+                return True
+        # Timing arguments always lead to a state change, and are cheaper to check
+        # than the comparisons with the current state below.
+        if kwargs.get(_HM_ARG_RAMP_TIME) is not None:
             return True
-        if kwargs.get(HM_ARG_OFF) is not None and self.is_on is not False and len(kwargs) == 1:
+        if kwargs.get(HM_ARG_ON_TIME) is not None:
             return True
         if (
             brightness := kwargs.get(_HM_ARG_BRIGHTNESS)
@@ -264,10 +322,6 @@ class BaseHmLight(CustomEntity, OnTimeMixin):
             return True
         if (effect := kwargs.get(_HM_ARG_EFFECT)) is not None and effect != self.effect:
             return True
-        if kwargs.get(_HM_ARG_RAMP_TIME) is not None:
-            return True
-        if kwargs.get(HM_ARG_ON_TIME) is not None:
-            return True
         return super().is_state_change(**kwargs)
 
 
@@ -284,7 +338,7 @@ class CeDimmer(BaseHmLight):
     @value_property
     def is_on(self) -> bool | None:
         """Return true if dimmer is on."""
-        return self._e_level.value is not None and self._e_level.value > _HM_DIMMER_OFF
+        return (level := self._e_level.value) is not None and level > _HM_DIMMER_OFF
 
     @value_property
     def brightness(self) -> int | None:
@@ -294,14 +348,16 @@ class CeDimmer(BaseHmLight):
     @value_property
     def channel_brightness(self) -> int | None:
         """Return the channel_brightness of this light between 0..255."""
-        if self._e_channel_level.value is not None:
-            return int(self._e_channel_level.value * 255)
+        if (channel_level := self._e_channel_level.value) is not None:
+            return int(channel_level * 255)
         return None
 
 
 class CeColorDimmer(CeDimmer):
     """Class for HomeMatic dimmer with color entities."""
 
+    _attr_supports_hs_color: bool = True
+
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
         super()._init_entity_fields()
@@ -310,8 +366,7 @@ class CeColorDimmer(CeDimmer):
     @value_property
     def hs_color(self) -> tuple[float, float] | None:
         """Return the hue and saturation color value [float, float]."""
-        if self._e_color.value is not None:
-            color = self._e_color.value
+        if (color := self._e_color.value) is not None:
             if color >= 200:
                 # 200 is a special case (white), so we have a saturation of 0.
                 # Larger values are undefined.
@@ -322,36 +377,26 @@ class CeColorDimmer(CeDimmer):
             return color / 200 * 360, 100
         return 0.0, 0.0
 
-    @config_property
-    def supports_hs_color(self) -> bool:
-        """Flag if light supports color temperature."""
-        return True
-
-    @config_property
-    def supports_effects(self) -> bool:
-        """Flag if light supports effects."""
-        return False
-
-    @bind_collector
-    async def turn_on(
-        self, collector: CallParameterCollector | None = None, **kwargs: Any
+    async def _turn_on_impl(
+        self, collector: CallParameterCollector | None, args: HmLightArgs
     ) -> None:
         """Turn the light on."""
-        if not self.is_state_change(on=True, **kwargs):
-            return
-        if (hs_color := kwargs.get(_HM_ARG_HS_COLOR)) is not None:
+        if (hs_color := args.get(_HM_ARG_HS_COLOR)) is not None:
             khue, ksaturation = hs_color
             hue = khue / 360
             saturation = ksaturation / 100
             color = 200 if saturation < 0.1 else int(round(max(min(hue, 1), 0) * 199))
-            await self._e_color.send_value(value=color, collector=collector)
-        await super().turn_on(collector=collector, **kwargs)
+            if _is_changed(entity=self._e_color, value=color):
+                await self._e_color.send_value(value=color, collector=collector)
+        await super()._turn_on_impl(collector=collector, args=args)
 
 
 class CeColorDimmerEffect(CeColorDimmer):
     """Class for HomeMatic dimmer with color entities."""
 
-    _effect_list: list[str] = [
+    _attr_supports_effects: bool = True
+
+    _effect_list: tuple[str, ...] = (
         _HM_EFFECT_OFF,
         "Slow color change",
         "Medium color change",
@@ -359,7 +404,8 @@ class CeColorDimmerEffect(CeColorDimmer):
         "Campfire",
         "Waterfall",
         "TV simulation",
-    ]
+    )
+    _effect_index: Final[dict[str, int]] = {effect: idx for idx, effect in enumerate(_effect_list)}
 
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
@@ -368,49 +414,37 @@ class CeColorDimmerEffect(CeColorDimmer):
             field_name=FIELD_PROGRAM, entity_type=HmInteger
         )
 
-    @config_property
-    def supports_effects(self) -> bool:
-        """Flag if light supports effects."""
-        return True
-
     @value_property
     def effect(self) -> str | None:
         """Return the current effect."""
-        if self._e_effect.value is not None:
-            return self._effect_list[int(self._e_effect.value)]
+        if (effect := self._e_effect.value) is not None:
+            return self._effect_list[int(effect)]
         return None
 
     @value_property
     def effect_list(self) -> list[str] | None:
         """Return the list of supported effects."""
-        return self._effect_list
+        return list(self._effect_list)
 
-    @bind_collector
-    async def turn_on(
-        self, collector: CallParameterCollector | None = None, **kwargs: Any
+    async def _turn_on_impl(
+        self, collector: CallParameterCollector | None, args: HmLightArgs
     ) -> None:
         """Turn the light on."""
-        if not self.is_state_change(on=True, **kwargs):
-            return
-
-        if (
-            _HM_ARG_EFFECT not in kwargs
-            and self.supports_effects
-            and self.effect != _HM_EFFECT_OFF
-        ):
-            await self._e_effect.send_value(value=0, collector=collector)
-
-        if self.supports_effects and (effect := kwargs.get(_HM_ARG_EFFECT)) is not None:
-            effect_idx = self._effect_list.index(effect)
-            if effect_idx is not None:
+        if (effect := args.get(_HM_ARG_EFFECT)) is not None:
+            if (effect_idx := self._effect_index.get(effect)) is not None:
                 await self._e_effect.send_value(value=effect_idx, collector=collector)
+        # Index 0 of the effect list is the effect off.
+        elif self._e_effect.value != 0:
+            await self._e_effect.send_value(value=0, collector=collector)
 
-        await super().turn_on(collector=collector, **kwargs)
+        await super()._turn_on_impl(collector=collector, args=args)
 
 
 class CeColorTempDimmer(CeDimmer):
     """Class for HomeMatic dimmer with color temperature entities."""
 
+    _attr_supports_color_temperature: bool = True
+
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
         super()._init_entity_fields()
@@ -421,32 +455,27 @@ class CeColorTempDimmer(CeDimmer):
     @value_property
     def color_temp(self) -> int | None:
         """Return the color temperature in mireds of this light between 153..500."""
-        return int(
-            _HM_MAX_MIREDS - (_HM_MAX_MIREDS - _HM_MIN_MIREDS) * (self._e_color_level.value or 0.0)
-        )
+        return int(_HM_MAX_MIREDS - _HM_MIRED_RANGE * (self._e_color_level.value or 0.0))
 
-    @config_property
-    def supports_color_temperature(self) -> bool:
-        """Flag if light supports color temperature."""
-        return True
-
-    @bind_collector
-    async def turn_on(
-        self, collector: CallParameterCollector | None = None, **kwargs: Any
+    async def _turn_on_impl(
+        self, collector: CallParameterCollector | None, args: HmLightArgs
     ) -> None:
         """Turn the light on."""
-        if not self.is_state_change(on=True, **kwargs):
-            return
-        if (color_temp := kwargs.get(_HM_ARG_COLOR_TEMP)) is not None:
-            color_level = (_HM_MAX_MIREDS - color_temp) / (_HM_MAX_MIREDS - _HM_MIN_MIREDS)
-            await self._e_color_level.send_value(value=color_level, collector=collector)
+        if (color_temp := args.get(_HM_ARG_COLOR_TEMP)) is not None:
+            color_level = (_HM_MAX_MIREDS - color_temp) / _HM_MIRED_RANGE
+            if _is_changed(
+                entity=self._e_color_level, value=color_level, abs_tol=_COLOR_LEVEL_TOLERANCE
+            ):
+                await self._e_color_level.send_value(value=color_level, collector=collector)
 
-        await super().turn_on(collector=collector, **kwargs)
+        await super()._turn_on_impl(collector=collector, args=args)
 
 
 class CeIpRGBWLight(BaseHmLight):
     """Class for HomematicIP HmIP-RGBW light entities."""
 
+    _attr_supports_effects: bool = True
+
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
         super()._init_entity_fields()
@@ -473,11 +502,12 @@ class CeIpRGBWLight(BaseHmLight):
         self._e_saturation: HmFloat = self._get_entity(
             field_name=FIELD_SATURATION, entity_type=HmFloat
         )
+        self._attr_supports_transition = True
 
     @value_property
     def is_on(self) -> bool | None:
         """Return true if light is on."""
-        return self._e_level.value is not None and self._e_level.value > _HM_DIMMER_OFF
+        return (level := self._e_level.value) is not None and level > _HM_DIMMER_OFF
 
     @value_property
     def brightness(self) -> int | None:
@@ -487,15 +517,17 @@ class CeIpRGBWLight(BaseHmLight):
     @value_property
     def color_temp(self) -> int | None:
         """Return the color temperature in mireds of this light between 153..500."""
-        if not self._e_color_temperature_kelvin.value:
+        if not (color_temperature_kelvin := self._e_color_temperature_kelvin.value):
             return None
-        return math.floor(1000000 / self._e_color_temperature_kelvin.value)
+        return round(_MIRED_KELVIN_FACTOR / color_temperature_kelvin)
 
     @value_property
     def hs_color(self) -> tuple[float, float] | None:
         """Return the hue and saturation color value [float, float]."""
-        if self._e_hue.value is not None and self._e_saturation.value is not None:
-            return self._e_hue.value, self._e_saturation.value * 100
+        if (hue := self._e_hue.value) is not None and (
+            saturation := self._e_saturation.value
+        ) is not None:
+            return hue, saturation * 100
         return None
 
     @config_property
@@ -503,21 +535,11 @@ class CeIpRGBWLight(BaseHmLight):
         """Flag if light supports color temperature."""
         return self._e_device_operation_mode.value == _DOM_TUNABLE_WHITE
 
-    @config_property
-    def supports_effects(self) -> bool:
-        """Flag if light supports effects."""
-        return True
-
     @config_property
     def supports_hs_color(self) -> bool:
         """Flag if light supports color."""
         return self._e_device_operation_mode.value in (_DOM_RGBW, _DOM_RGB)
 
-    @config_property
-    def supports_transition(self) -> bool:
-        """Flag if light supports transition."""
-        return True
-
     @config_property
     def usage(self) -> HmEntityUsage:
         """
@@ -539,29 +561,29 @@ class CeIpRGBWLight(BaseHmLight):
         """Return the list of supported effects."""
         return list(self._e_effect.value_list or ())
 
-    @bind_collector
-    async def turn_on(
-        self,
-        collector: CallParameterCollector | None = None,
-        **kwargs: Any,
+    async def _turn_on_impl(
+        self, collector: CallParameterCollector | None, args: HmLightArgs
     ) -> None:
         """Turn the light on."""
-        if not self.is_state_change(on=True, **kwargs):
-            return
-        if (hs_color := kwargs.get(_HM_ARG_HS_COLOR)) is not None:
+        if (hs_color := args.get(_HM_ARG_HS_COLOR)) is not None:
             hue, ksaturation = hs_color
             saturation = ksaturation / 100
-            await self._e_hue.send_value(value=int(hue), collector=collector)
-            await self._e_saturation.send_value(value=saturation, collector=collector)
-        if color_temp := kwargs.get(_HM_ARG_COLOR_TEMP):
-            color_temp_kelvin = math.floor(1000000 / color_temp)
-            await self._e_color_temperature_kelvin.send_value(
-                value=color_temp_kelvin, collector=collector
-            )
-        if self.supports_effects and (effect := kwargs.get(_HM_ARG_EFFECT)) is not None:
+            if _is_changed(entity=self._e_hue, value=(hue := int(hue))):
+                await self._e_hue.send_value(value=hue, collector=collector)
+            if _is_changed(
+                entity=self._e_saturation, value=saturation, abs_tol=_SATURATION_TOLERANCE
+            ):
+                await self._e_saturation.send_value(value=saturation, collector=collector)
+        if color_temp := args.get(_HM_ARG_COLOR_TEMP):
+            color_temp_kelvin = round(_MIRED_KELVIN_FACTOR / color_temp)
+            if _is_changed(entity=self._e_color_temperature_kelvin, value=color_temp_kelvin):
+                await self._e_color_temperature_kelvin.send_value(
+                    value=color_temp_kelvin, collector=collector
+                )
+        if self.supports_effects and (effect := args.get(_HM_ARG_EFFECT)) is not None:
             await self._e_effect.send_value(value=effect, collector=collector)
 
-        await super().turn_on(collector=collector, **kwargs)
+        await super()._turn_on_impl(collector=collector, args=args)
 
     async def _set_ramp_time_on_value(
         self, ramp_time: float, collector: CallParameterCollector | None = None
@@ -585,15 +607,7 @@ class CeIpRGBWLight(BaseHmLight):
 class CeIpFixedColorLight(BaseHmLight):
     """Class for HomematicIP HmIP-BSL light entities."""
 
-    _color_switcher: dict[str, tuple[float, float]] = {
-        _COLOR_WHITE: (0.0, 0.0),
-        _COLOR_RED: (0.0, 100.0),
-        _COLOR_YELLOW: (60.0, 100.0),
-        _COLOR_GREEN: (120.0, 100.0),
-        _COLOR_TURQUOISE: (180.0, 100.0),
-        _COLOR_BLUE: (240.0, 100.0),
-        _COLOR_PURPLE: (300.0, 100.0),
-    }
+    _attr_supports_hs_color: bool = True
 
     @value_property
     def color_name(self) -> str | None:
@@ -626,7 +640,7 @@ class CeIpFixedColorLight(BaseHmLight):
     @value_property
     def is_on(self) -> bool | None:
         """Return true if dimmer is on."""
-        return self._e_level.value is not None and self._e_level.value > 0.0
+        return (level := self._e_level.value) is not None and level > 0.0
 
     @value_property
     def brightness(self) -> int | None:
@@ -636,46 +650,39 @@ class CeIpFixedColorLight(BaseHmLight):
     @value_property
     def channel_brightness(self) -> int | None:
         """Return the channel brightness of this light between 0..255."""
-        if self._e_channel_level.value is not None:
-            return int(self._e_channel_level.value * 255)
+        if (channel_level := self._e_channel_level.value) is not None:
+            return int(channel_level * 255)
         return None
 
     @value_property
     def hs_color(self) -> tuple[float, float] | None:
         """Return the hue and saturation color value [float, float]."""
-        if (
-            self._e_color.value is not None
-            and (hs_color := self._color_switcher.get(self._e_color.value)) is not None
-        ):
+        if (color := self._e_color.value) is not None and (
+            hs_color := _COLOR_SWITCHER.get(color)
+        ) is not None:
             return hs_color
         return 0.0, 0.0
 
     @value_property
     def channel_hs_color(self) -> tuple[float, float] | None:
         """Return the channel hue and saturation color value [float, float]."""
-        if self._e_channel_color.value is not None:
-            return self._color_switcher.get(self._e_channel_color.value, (0.0, 0.0))
+        if (channel_color := self._e_channel_color.value) is not None:
+            return _COLOR_SWITCHER.get(channel_color, (0.0, 0.0))
         return None
 
-    @config_property
-    def supports_hs_color(self) -> bool:
-        """Flag if light supports color."""
-        return True
-
-    @bind_collector
-    async def turn_on(
-        self, collector: CallParameterCollector | None = None, **kwargs: Any
+    async def _turn_on_impl(
+        self, collector: CallParameterCollector | None, args: HmLightArgs
     ) -> None:
         """Turn the light on."""
-        if not self.is_state_change(on=True, **kwargs):
-            return
-        if (hs_color := kwargs.get(_HM_ARG_HS_COLOR)) is not None:
-            simple_rgb_color = _convert_color(hs_color)
-            await self._e_color.send_value(value=simple_rgb_color, collector=collector)
+        if (hs_color := args.get(_HM_ARG_HS_COLOR)) is not None:
+            if _is_changed(
+                entity=self._e_color, value=(simple_rgb_color := _convert_color(hs_color))
+            ):
+                await self._e_color.send_value(value=simple_rgb_color, collector=collector)
         elif self.color_name in _NO_COLOR:
             await self._e_color.send_value(value=_COLOR_WHITE, collector=collector)
 
-        await super().turn_on(collector=collector, **kwargs)
+        await super()._turn_on_impl(collector=collector, args=args)
 
     @bind_collector
     async def _set_on_time_value(
@@ -698,69 +705,69 @@ class CeIpFixedColorLight(BaseHmLight):
 class CeIpFixedColorLightWired(CeIpFixedColorLight):
     """Class for HomematicIP HmIPW-WRC6 light entities."""
 
+    _attr_supports_effects: bool = True
+
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
         super()._init_entity_fields()
         self._e_color_behaviour: HmSelect = self._get_entity(
             field_name=FIELD_COLOR_BEHAVIOUR, entity_type=HmSelect
         )
-        self._effect_list = (
-            [
+        self._effect_list: tuple[str, ...] = (
+            tuple(
                 item
                 for item in self._e_color_behaviour.value_list
                 if item not in _EXCLUDE_FROM_COLOR_BEHAVIOUR
-            ]
+            )
             if (self._e_color_behaviour and self._e_color_behaviour.value_list)
-            else []
+            else ()
         )
-
-    @config_property
-    def supports_effects(self) -> bool:
-        """Flag if light supports effects."""
-        return True
+        self._effects: frozenset[str] = frozenset(self._effect_list)
 
     @value_property
     def effect(self) -> str | None:
         """Return the current effect."""
-        if (effect := self._e_color_behaviour.value) is not None and effect in self._effect_list:
+        if (effect := self._e_color_behaviour.value) is not None and effect in self._effects:
             return effect
         return None
 
     @value_property
     def effect_list(self) -> list[str] | None:
         """Return the list of supported effects."""
-        return self._effect_list
+        return list(self._effect_list)
 
-    @bind_collector
-    async def turn_on(
-        self, collector: CallParameterCollector | None = None, **kwargs: Any
+    async def _turn_on_impl(
+        self, collector: CallParameterCollector | None, args: HmLightArgs
     ) -> None:
         """Turn the light on."""
-        if not self.is_state_change(on=True, **kwargs):
-            return
-
-        if (effect := kwargs.get(_HM_ARG_EFFECT)) is not None and effect in self._effect_list:
+        if (effect := args.get(_HM_ARG_EFFECT)) is not None and effect in self._effects:
             await self._e_color_behaviour.send_value(value=effect, collector=collector)
-        elif self._e_color_behaviour.value not in self._effect_list:
+        elif self._e_color_behaviour.value not in self._effects:
             await self._e_color_behaviour.send_value(
                 value=_COLOR_BEHAVIOUR_ON, collector=collector
             )
         elif (color_behaviour := self._e_color_behaviour.value) is not None:
             await self._e_color_behaviour.send_value(value=color_behaviour, collector=collector)
 
-        await super().turn_on(collector=collector, **kwargs)
+        await super()._turn_on_impl(collector=collector, args=args)
 
 
 def _recalc_unit_timer(time: float) -> tuple[float, int]:
     """Recalculate unit and value of timer."""
-    ramp_time_unit = _TIME_UNIT_SECONDS
-    if time > 16343:
-        time /= 60
-        ramp_time_unit = _TIME_UNIT_MINUTES
-    if time > 16343:
-        time /= 60
-        ramp_time_unit = _TIME_UNIT_HOURS
-    return time, ramp_time_unit
+    if time <= _TIMER_MAX_VALUE:
+        return time, _TIME_UNIT_SECONDS
+    if time <= _TIMER_MAX_VALUE * 60:
+        return time / 60, _TIME_UNIT_MINUTES
+    return time / 3600, _TIME_UNIT_HOURS
+
+
+def _is_changed(entity: GenericEntity, value: Any, abs_tol: float | None = None) -> bool:
+    """Return if a value differs from the value of the entity or its state is uncertain."""
+    if entity.state_uncertain or (current_value := entity.value) is None:
+        return True
+    if abs_tol is None:
+        return bool(value != current_value)
+    return not math.isclose(value, current_value, abs_tol=abs_tol)
 
 
 def _convert_color(color: tuple[float, float]) -> str:
@@ -774,16 +781,9 @@ def _convert_color(color: tuple[float, float]) -> str:
     saturation: int = int(color[1])
     if saturation < 5:
         return _COLOR_WHITE
-    if 30 < hue <= 90:
-        return _COLOR_YELLOW
-    if 90 < hue <= 150:
-        return _COLOR_GREEN
-    if 150 < hue <= 210:
-        return _COLOR_TURQUOISE
-    if 210 < hue <= 270:
-        return _COLOR_BLUE
-    if 270 < hue <= 330:
-        return _COLOR_PURPLE
+    # Each color covers 60 degrees of hue, starting with yellow at (30, 90].
+    if 0 <= (bucket := (hue - 31) // 60) < len(_HUE_COLORS):
+        return _HUE_COLORS[bucket]
     return _COLOR_RED
 
 
@@ -1029,4 +1029,4 @@ DEVICES: dict[str, CustomConfig | tuple[CustomConfig, ...]] = {
     ),
     "OLIGO.smart.iq.HM": CustomConfig(func=make_rf_dimmer, channels=(1, 2, 3, 4, 5, 6)),
 }
-hmed.ALL_DEVICES.append(DEVICES)
+hmed.register_devices(devices=DEVICES)
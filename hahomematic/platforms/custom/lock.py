@@ -252,4 +252,4 @@ DEVICES: dict[str, CustomConfig | tuple[CustomConfig, ...]] = {
     ),
 }
 
-hmed.ALL_DEVICES.append(DEVICES)
+hmed.register_devices(devices=DEVICES)
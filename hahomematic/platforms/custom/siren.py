@@ -282,4 +282,4 @@ DEVICES: dict[str, CustomConfig | tuple[CustomConfig, ...]] = {
     "HmIP-ASIR": CustomConfig(func=make_ip_siren, channels=(0,)),
     "HmIP-SWSD": CustomConfig(func=make_ip_siren_smoke, channels=(0,)),
 }
-hmed.ALL_DEVICES.append(DEVICES)
+hmed.register_devices(devices=DEVICES)
@@ -146,4 +146,4 @@ DEVICES: dict[str, CustomConfig | tuple[CustomConfig, ...]] = {
     ),
     "HmIPW-FIO6": CustomConfig(func=make_ip_switch, channels=(7, 11, 15, 19, 23, 27)),
 }
-hmed.ALL_DEVICES.append(DEVICES)
+hmed.register_devices(devices=DEVICES)
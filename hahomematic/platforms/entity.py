@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 from collections.abc import Callable
 from datetime import datetime
 import logging
+import re
+from sys import intern
 from typing import Any, Final, Generic, TypeVar, cast
 
 import voluptuous as vol
@@ -43,9 +45,11 @@ from hahomematic.platforms.support import (
 
 _LOGGER = logging.getLogger(__name__)
 
-_CONFIGURABLE_CHANNEL: Final[tuple[str, ...]] = (
-    "KEY_TRANSCEIVER",
-    "MULTI_MODE_INPUT_TRANSMITTER",
+_CONFIGURABLE_CHANNEL: Final[frozenset[str]] = frozenset(
+    (
+        "KEY_TRANSCEIVER",
+        "MULTI_MODE_INPUT_TRANSMITTER",
+    )
 )
 
 _FIX_UNIT_REPLACE: Final[dict[str, str]] = {
@@ -57,6 +61,9 @@ _FIX_UNIT_REPLACE: Final[dict[str, str]] = {
     "m3": "m³",
 }
 
+# Matches the first fragment of a raw unit, that has to be replaced.
+_FIX_UNIT_PATTERN: Final = re.compile("|".join(map(re.escape, _FIX_UNIT_REPLACE)))
+
 _FIX_UNIT_BY_PARAM: Final[dict[str, str]] = {
     "ACTUAL_TEMPERATURE": "°C",
     "CURRENT_ILLUMINATION": "lx",
@@ -190,7 +197,7 @@ class BaseEntity(CallbackEntity, PayloadMixin):
         )
         self._attr_is_in_multiple_channels: Final = is_in_multiple_channels
         self._central: Final[hmcu.CentralUnit] = device.central
-        self._channel_type: Final = str(device.channels[self._attr_channel_address].type)
+        self._channel_type: Final = intern(str(device.channels[self._attr_channel_address].type))
         self._attr_function: Final = self._central.device_details.get_function_text(
             address=self._attr_channel_address
         )
@@ -203,11 +210,14 @@ class BaseEntity(CallbackEntity, PayloadMixin):
         self._attr_channel_name: Final = entity_name_data.channel_name
         self._attr_full_name: Final = entity_name_data.full_name
         self._attr_name: Final = entity_name_data.entity_name
+        self._attr_address_path: Final = (
+            f"{self._attr_platform}/{device.interface_id}/{unique_identifier}/"
+        )
 
     @property
     def address_path(self) -> str:
         """Return the address pass of the entity."""
-        return f"{self._attr_platform}/{self.device.interface_id}/{self._attr_unique_identifier}/"
+        return self._attr_address_path
 
     @property
     def available(self) -> bool:
@@ -311,7 +321,8 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
         """Initialize the entity."""
         self._attr_paramset_key: Final[str] = paramset_key
         # required for name in BaseEntity
-        self._attr_parameter: Final[str] = parameter
+        # Interned, because the parameter is looked up in many dicts keyed by parameter names.
+        self._attr_parameter: Final[str] = intern(parameter)
 
         super().__init__(
             device=device,
@@ -321,6 +332,13 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
                 channel_address=channel_address, parameter=parameter
             ),
         )
+        # The channel operation modes, that enable this entity/event.
+        # None, if the usage doesn't depend on the channel operation mode.
+        self._channel_operation_mode_visibility: Final[tuple[str, ...] | None] = (
+            KEY_CHANNEL_OPERATION_MODE_VISIBILITY.get(self._attr_parameter)
+            if self._channel_type in _CONFIGURABLE_CHANNEL
+            else None
+        )
         self._attr_value: ParameterT | None = None
         self._attr_last_update: datetime = INIT_DATETIME
         self._attr_state_uncertain: bool = True
@@ -331,7 +349,11 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
         self._attr_type: HmType = HmType(parameter_data[HmDescription.TYPE])
         self._attr_value_list: tuple[str, ...] | None = None
         if HmDescription.VALUE_LIST in parameter_data:
-            self._attr_value_list = tuple(parameter_data[HmDescription.VALUE_LIST])
+            # The value names are interned, because they are mostly compared with,
+            # or looked up by, the constants of the custom entities.
+            self._attr_value_list = tuple(
+                intern(item) for item in parameter_data[HmDescription.VALUE_LIST]
+            )
         self._attr_max: ParameterT = self._convert_value(parameter_data[HmDescription.MAX])
         self._attr_min: ParameterT = self._convert_value(parameter_data[HmDescription.MIN])
         self._attr_default: ParameterT = self._convert_value(
@@ -341,6 +363,9 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
         self._attr_visible: bool = flags & HmFlag.VISIBLE == HmFlag.VISIBLE
         self._attr_service: bool = flags & HmFlag.SERVICE == HmFlag.SERVICE
         self._attr_operations: int = parameter_data[HmDescription.OPERATIONS]
+        self._attr_is_readable: bool = bool(self._attr_operations & HmOperations.READ)
+        self._attr_is_writeable: bool = bool(self._attr_operations & HmOperations.WRITE)
+        self._attr_supports_events: bool = bool(self._attr_operations & HmOperations.EVENT)
         self._attr_special: dict[str, Any] | None = parameter_data.get(HmDescription.SPECIAL)
         self._attr_raw_unit: str | None = parameter_data.get(HmDescription.UNIT)
         self._attr_unit: str | None = self._fix_unit(raw_unit=self._attr_raw_unit)
@@ -393,7 +418,7 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
     @property
     def is_readable(self) -> bool:
         """Return, if entity is readable."""
-        return bool(self._attr_operations & HmOperations.READ)
+        return self._attr_is_readable
 
     @value_property
     def is_valid(self) -> bool:
@@ -403,7 +428,7 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
     @property
     def is_writeable(self) -> bool:
         """Return, if entity is writeable."""
-        return bool(self._attr_operations & HmOperations.WRITE)
+        return self._attr_is_writeable
 
     @value_property
     def last_update(self) -> datetime:
@@ -423,7 +448,7 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
     @property
     def supports_events(self) -> bool:
         """Return, if entity is supports events."""
-        return bool(self._attr_operations & HmOperations.EVENT)
+        return self._attr_supports_events
 
     @config_property
     def unit(self) -> str | None:
@@ -453,13 +478,11 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
     @property
     def _enabled_by_channel_operation_mode(self) -> bool | None:
         """Return, if the entity/event must be enabled."""
-        if self._channel_type not in _CONFIGURABLE_CHANNEL:
-            return None
-        if self._attr_parameter not in KEY_CHANNEL_OPERATION_MODE_VISIBILITY:
+        if (visibility := self._channel_operation_mode_visibility) is None:
             return None
         if (cop := self._channel_operation_mode) is None:
             return None
-        return cop in KEY_CHANNEL_OPERATION_MODE_VISIBILITY[self._attr_parameter]
+        return cop in visibility
 
     def _fix_unit(self, raw_unit: str | None) -> str | None:
         """Replace given unit."""
@@ -467,9 +490,10 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
             return new_unit
         if not raw_unit:
             return None
-        for check, fix in _FIX_UNIT_REPLACE.items():
-            if check in raw_unit:
-                return fix
+        if (fix := _FIX_UNIT_REPLACE.get(raw_unit)) is not None:
+            return fix
+        if match := _FIX_UNIT_PATTERN.search(raw_unit):
+            return _FIX_UNIT_REPLACE[match.group()]
         return raw_unit
 
     @abstractmethod
@@ -486,7 +510,7 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
             return
 
         # Check, if entity is readable
-        if not self.is_readable:
+        if not self._attr_is_readable:
             return
 
         self.update_value(
@@ -501,11 +525,16 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
     def update_value(self, value: Any) -> None:
         """Update value of the entity."""
         if value == NO_CACHE_ENTRY:
-            if self.last_update != INIT_DATETIME:
+            if self._attr_last_update != INIT_DATETIME:
                 self._attr_state_uncertain = True
                 self.update_entity()
             return
-        self._attr_value = self._convert_value(value)
+        converted_value = self._convert_value(value)
+        # An unchanged, certain value only refreshes the last_update, without callbacks.
+        if converted_value == self._attr_value and not self._attr_state_uncertain:
+            self._set_last_update()
+            return
+        self._attr_value = converted_value
         self._attr_state_uncertain = False
         self._set_last_update()
         self.update_entity()
@@ -513,7 +542,7 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
     def update_parameter_data(self) -> None:
         """Update parameter data."""
         self._assign_parameter_data(
-            parameter_data=self.device.central.paramset_descriptions.get_parameter_data(
+            parameter_data=self._central.paramset_descriptions.get_parameter_data(
                 interface_id=self.device.interface_id,
                 channel_address=self._attr_channel_address,
                 paramset_key=self._attr_paramset_key,
@@ -529,16 +558,11 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
             if (
                 self._attr_type == HmType.BOOL
                 and self._attr_value_list is not None
-                and value is not None
                 and isinstance(value, str)
             ):
-                return convert_value(  # type: ignore[no-any-return]
-                    value=self._attr_value_list.index(value),
-                    target_type=self._attr_type,
-                    value_list=self.value_list,
-                )
+                value = self._attr_value_list.index(value)
             return convert_value(  # type: ignore[no-any-return]
-                value=value, target_type=self._attr_type, value_list=self.value_list
+                value=value, target_type=self._attr_type, value_list=self._attr_value_list
             )
         except ValueError:  # pragma: no cover
             _LOGGER.debug(
@@ -552,7 +576,7 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
 
     def get_event_data(self, value: Any = None) -> dict[str, Any]:
         """Get the event_data."""
-        event_data = {
+        event_data: dict[str, Any] = {
             EVENT_ADDRESS: self.device.device_address,
             EVENT_CHANNEL_NO: self._attr_channel_no,
             EVENT_DEVICE_TYPE: self.device.device_type,
@@ -561,7 +585,11 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
         }
         if value is not None:
             event_data[EVENT_VALUE] = value
-        return cast(dict[str, Any], HM_EVENT_DATA_SCHEMA(event_data))
+        # The other fields are typed strings, so only the channel no and the value
+        # can violate HM_EVENT_DATA_SCHEMA. The schema is only run for these cases.
+        if self._attr_channel_no is None or (value is not None and not isinstance(value, int)):
+            return cast(dict[str, Any], HM_EVENT_DATA_SCHEMA(event_data))
+        return event_data
 
     def _set_last_update(self) -> None:
         """Set last_update to current datetime."""
@@ -583,14 +611,17 @@ class CallParameterCollector:
         """Add a generic entity."""
         if use_put_paramset is False:
             self._use_put_paramset = False
-        if entity.channel_address not in self._paramsets:
-            self._paramsets[entity.channel_address] = {}
-        self._paramsets[entity.channel_address][entity.parameter] = value
+        # The stored fields are read directly to avoid the config property calls.
+        # pylint: disable=protected-access
+        channel_address = entity._attr_channel_address
+        parameter = entity._attr_parameter
+        self._paramsets.setdefault(channel_address, {})[parameter] = value
 
     async def send_data(self) -> bool:
         """Send data to backend."""
+        # The channels are sent in order, and sending stops at the first failed channel.
         for channel_address, paramset in self._paramsets.items():
-            if len(paramset.values()) == 1 or self._use_put_paramset is False:
+            if len(paramset) == 1 or self._use_put_paramset is False:
                 for parameter, value in paramset.items():
                     if not await self._client.set_value(
                         channel_address=channel_address,
@@ -598,7 +629,7 @@ class CallParameterCollector:
                         parameter=parameter,
                         value=value,
                     ):
-                        return False  # pragma: no cover
+                        return False
             elif not await self._client.put_paramset(
                 address=channel_address, paramset_key=HmParamsetKey.VALUES, value=paramset
             ):
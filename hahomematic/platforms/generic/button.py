@@ -21,4 +21,11 @@ class HmButton(GenericEntity[None, bool]):
 
     async def press(self) -> None:
         """Handle the button press."""
-        await self.send_value(value=True)
+        # Buttons are only created for writable parameters and always send True,
+        # so the generic validation and conversion of send_value is not required.
+        await self._client.set_value(
+            channel_address=self._attr_channel_address,
+            paramset_key=self._attr_paramset_key,
+            parameter=self._attr_parameter,
+            value=True,
+        )
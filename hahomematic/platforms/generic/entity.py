@@ -169,13 +169,14 @@ class WrapperEntity(hme.BaseEntity):
                 "Cannot create wrapped entity. platform must not be equivalent."
             )
         self._wrapped_entity: Final = wrapped_entity
+        # The platform must be set before the init, because it is part of the address path.
+        self._attr_platform = new_platform
         super().__init__(
             device=wrapped_entity.device,
             channel_no=wrapped_entity.channel_no,
             unique_identifier=f"{wrapped_entity.unique_identifier}_{new_platform}",
             is_in_multiple_channels=wrapped_entity.is_in_multiple_channels,
         )
-        self._attr_platform = new_platform
         # use callbacks from wrapped entity
         self._update_callbacks = wrapped_entity._update_callbacks
         self._remove_callbacks = wrapped_entity._remove_callbacks
@@ -172,9 +172,8 @@ class HmHub:
 
     def _identify_missing_program_ids(self, programs: list[ProgramData]) -> list[str]:
         """Identify missing programs."""
-        return [
-            pid for pid in self._central.program_entities if pid not in [x.pid for x in programs]
-        ]
+        program_ids = {x.pid for x in programs}
+        return [pid for pid in self._central.program_entities if pid not in program_ids]
 
     def _identify_missing_variable_names(self, variables: list[SystemVariableData]) -> set[str]:
         """Identify missing variables."""
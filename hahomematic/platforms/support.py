@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from datetime import datetime
+from functools import cache
 import logging
 from typing import Any, Final, Generic, TypeVar
 
@@ -25,6 +26,9 @@ S = TypeVar("S")
 
 _LOGGER = logging.getLogger(__name__)
 
+# Replace the separators of an address in a single pass.
+_UNIQUE_IDENTIFIER_TRANSLATION: Final = str.maketrans({":": "_", "-": "_"})
+
 # dict with binary_sensor relevant value lists and the corresponding TRUE value
 _BINARY_SENSOR_TRUE_VALUE_DICT_FOR_VALUE_LIST: Final[dict[tuple[str, ...], str]] = {
     ("CLOSED", "OPEN"): "OPEN",
@@ -251,10 +255,10 @@ def get_entity_name(
         device=device,
         channel_no=channel_no,
     ):
-        p_name = parameter.title().replace("_", " ")
+        p_name = _get_parameter_name(parameter=parameter)
 
         if _check_channel_name_with_channel_no(name=channel_name):
-            c_name = channel_name.split(":")[0]
+            c_name = channel_name.partition(":")[0]
             c_postfix = ""
             if central.paramset_descriptions.is_in_multiple_channels(
                 channel_address=channel_address, parameter=parameter
@@ -297,7 +301,7 @@ def get_event_name(
         device=device,
         channel_no=channel_no,
     ):
-        p_name = parameter.title().replace("_", " ")
+        p_name = _get_parameter_name(parameter=parameter)
         if _check_channel_name_with_channel_no(name=channel_name):
             c_name = "" if channel_no in (0, None) else f" ch{channel_no}"
             event_name = EntityNameData(
@@ -336,12 +340,13 @@ def get_custom_entity_name(
         channel_no=channel_no,
     ):
         if is_only_primary_channel and _check_channel_name_with_channel_no(name=channel_name):
-            return EntityNameData(device_name=device.name, channel_name=channel_name.split(":")[0])
+            return EntityNameData(
+                device_name=device.name, channel_name=channel_name.partition(":")[0]
+            )
         if _check_channel_name_with_channel_no(name=channel_name):
-            c_name = channel_name.split(":")[0]
-            p_name = channel_name.split(":")[1]
+            c_name, _, channel_part = channel_name.partition(":")
             marker = "ch" if usage == HmEntityUsage.CE_PRIMARY else "vch"
-            p_name = f"{marker}{p_name}"
+            p_name = f"{marker}{channel_part}"
             return EntityNameData(
                 device_name=device.name, channel_name=c_name, parameter_name=p_name
             )
@@ -368,7 +373,7 @@ def generate_unique_identifier(
     Central id is additionally used for heating groups.
     Prefix is used for events and buttons.
     """
-    unique_identifier = address.replace(":", "_").replace("-", "_")
+    unique_identifier = address.translate(_UNIQUE_IDENTIFIER_TRANSLATION)
     if parameter:
         unique_identifier = f"{unique_identifier}_{parameter}"
 
@@ -377,10 +382,10 @@ def generate_unique_identifier(
     if (
         address in (PROGRAM_ADDRESS, SYSVAR_ADDRESS)
         or address.startswith("INT000")
-        or address.split(":")[0] in HM_VIRTUAL_REMOTE_ADDRESSES
+        or address.partition(":")[0] in HM_VIRTUAL_REMOTE_ADDRESSES
     ):
         return f"{central.config.central_id}_{unique_identifier}".lower()
-    return f"{unique_identifier}".lower()
+    return unique_identifier.lower()
 
 
 def generate_channel_unique_identifier(
@@ -388,8 +393,8 @@ def generate_channel_unique_identifier(
     address: str,
 ) -> str:
     """Build unique identifier for a channel from address."""
-    unique_identifier = address.replace(":", "_").replace("-", "_")
-    if address.split(":")[0] in HM_VIRTUAL_REMOTE_ADDRESSES:
+    unique_identifier = address.translate(_UNIQUE_IDENTIFIER_TRANSLATION)
+    if address.partition(":")[0] in HM_VIRTUAL_REMOTE_ADDRESSES:
         return f"{central.config.central_id}_{unique_identifier}".lower()
     return unique_identifier.lower()
 
@@ -403,23 +408,28 @@ def _get_base_name_from_channel_or_device(
     channel_address = hms.get_channel_address(
         device_address=device.device_address, channel_no=channel_no
     )
-    default_channel_name = f"{device.device_type} {channel_address}"
     name = central.device_details.get_name(channel_address)
-    if name is None or name == default_channel_name:
+    if name is None or name == f"{device.device_type} {channel_address}":
         return hms.get_channel_address(device_address=device.name, channel_no=channel_no)
     return name
 
 
+@cache
+def _get_parameter_name(parameter: str) -> str:
+    """Return the readable name of a parameter."""
+    return parameter.title().replace("_", " ")
+
+
 def _check_channel_name_with_channel_no(name: str) -> bool:
     """Check if name contains channel and this is an int."""
-    if name.count(":") == 1:
-        channel_part = name.split(":")[1]
-        try:
-            int(channel_part)
-            return True
-        except ValueError:
-            return False
-    return False
+    _, sep, channel_part = name.partition(":")
+    if not sep or ":" in channel_part:
+        return False
+    try:
+        int(channel_part)
+        return True
+    except ValueError:
+        return False
 
 
 def convert_value(value: Any, target_type: HmType, value_list: tuple[str, ...] | None) -> Any:
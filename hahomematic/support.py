@@ -1,19 +1,19 @@
 """Helper functions used within hahomematic."""
 from __future__ import annotations
 
-import asyncio
 import base64
 from collections.abc import Callable, Collection
 import contextlib
 from dataclasses import dataclass, field
 from datetime import datetime
 from functools import cache, wraps
+import inspect
 import logging
 import os
 import re
 import socket
 import ssl
-from typing import Any, TypeVar
+from typing import Any, Final, TypeVar
 
 import voluptuous as vol
 
@@ -34,6 +34,8 @@ _LOGGER = logging.getLogger(__name__)
 
 _CallableT = TypeVar("_CallableT", bound=Callable[..., Any])
 
+_TRUE_VALUES: Final[frozenset[str]] = frozenset(("y", "yes", "t", "true", "on", "1"))
+
 HM_INTERFACE_EVENT_SCHEMA = vol.Schema(
     {
         vol.Required(EVENT_INTERFACE_ID): str,
@@ -57,13 +59,11 @@ def build_xml_rpc_uri(
     tls: bool = False,
 ) -> str:
     """Build XML-RPC API URL from components."""
-    scheme = "http"
+    scheme = "https" if tls else "http"
     if not path:
         path = ""
-    if path and not path.startswith("/"):
+    elif not path.startswith("/"):
         path = f"/{path}"
-    if tls:
-        scheme += "s"
     return f"{scheme}://{host}:{port}{path}"
 
 
@@ -94,15 +94,8 @@ def check_or_create_directory(directory: str) -> bool:
 
 def parse_sys_var(data_type: HmSysvarType | None, raw_value: Any) -> Any:
     """Parse system variables to fix type."""
-    # pylint: disable=no-else-return
-    if not data_type:
-        return raw_value
-    if data_type in (HmSysvarType.ALARM, HmSysvarType.LOGIC):
-        return to_bool(raw_value)
-    if data_type == HmSysvarType.HM_FLOAT:
-        return float(raw_value)
-    if data_type in (HmSysvarType.HM_INTEGER, HmSysvarType.LIST):
-        return int(raw_value)
+    if data_type and (converter := _SYSVAR_CONVERTERS.get(data_type)):
+        return converter(raw_value)
     return raw_value
 
 
@@ -114,8 +107,16 @@ def to_bool(value: Any) -> bool:
     if not isinstance(value, str):
         raise TypeError("invalid literal for boolean. Not a string.")
 
-    lower_value = value.lower()
-    return lower_value in ["y", "yes", "t", "true", "on", "1"]
+    return value.lower() in _TRUE_VALUES
+
+
+_SYSVAR_CONVERTERS: Final[dict[HmSysvarType, Callable[[Any], Any]]] = {
+    HmSysvarType.ALARM: to_bool,
+    HmSysvarType.HM_FLOAT: float,
+    HmSysvarType.HM_INTEGER: int,
+    HmSysvarType.LIST: int,
+    HmSysvarType.LOGIC: to_bool,
+}
 
 
 def check_password(password: str | None) -> bool:
@@ -173,8 +174,9 @@ def updated_within_seconds(last_update: datetime, max_age_seconds: int | float)
     """Entity has been updated within X minutes."""
     if last_update == INIT_DATETIME:
         return False
-    delta = datetime.now() - last_update
-    if delta.seconds < max_age_seconds:
+    delta = (datetime.now() - last_update).total_seconds()
+    # A negative delta means the wall clock has been set back. Treat as outdated.
+    if 0 <= delta < max_age_seconds:
         return True
     return False
 
@@ -344,6 +346,6 @@ def measure_execution_time(func: _CallableT) -> _CallableT:
                     kwargs,
                 )
 
-    if asyncio.iscoroutinefunction(func):
+    if inspect.iscoroutinefunction(func):
         return async_wrapper  # type: ignore[return-value]
     return wrapper  # type: ignore[return-value]
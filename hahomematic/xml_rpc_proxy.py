@@ -1,28 +1,25 @@
-"""Implementation of a locking ServerProxy for XML-RPC communication."""
+"""Implementation of an async XML-RPC proxy based on aiohttp."""
 from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum, StrEnum
 import errno
 import logging
 from ssl import SSLError
-from typing import Any, Final, TypeVar
+from typing import Any, Final
 import xmlrpc.client
 
-from hahomematic import central_unit as hmcu
+from aiohttp import ClientConnectionError, ClientSession, ClientTimeout
+
+from hahomematic import central_unit as hmcu, config
 from hahomematic.exceptions import AuthFailure, ClientException, NoConnection
 from hahomematic.support import get_tls_context, reduce_args
 
 _LOGGER = logging.getLogger(__name__)
 
-_T = TypeVar("_T")
-
-_CONTEXT: Final = "context"
 _ENCODING_ISO_8859_1: Final = "ISO-8859-1"
-_TLS: Final = "tls"
-_VERIFY_TLS: Final = "verify_tls"
+_HEADERS: Final[dict[str, str]] = {"Content-Type": "text/xml"}
 _VALID_XMLRPC_COMMANDS_ON_NO_CONNECTION: Final[tuple[str, ...]] = (
     "getVersion",
     "init",
@@ -30,6 +27,16 @@ _VALID_XMLRPC_COMMANDS_ON_NO_CONNECTION: Final[tuple[str, ...]] = (
     "ping",
 )
 
+# Commands, that might take much longer than config.TIMEOUT until the backend responds.
+_LONG_RUNNING_XMLRPC_COMMANDS: Final[frozenset[str]] = frozenset(
+    (
+        "init",
+        "installFirmware",
+        "listDevices",
+        "updateFirmware",
+    )
+)
+
 _SSL_ERROR_CODES: Final[dict[int, str]] = {
     errno.ENOEXEC: "EOF occurred in violation of protocol",
 }
@@ -43,47 +50,57 @@ _NO_CONNECTION_ERROR_CODES: Final[dict[int, str]] = {
 
 
 # noinspection PyProtectedMember,PyUnresolvedReferences
-class XmlRpcProxy(xmlrpc.client.ServerProxy):
-    """ServerProxy implementation with ThreadPoolExecutor when request is executing."""
+class XmlRpcProxy:
+    """Async XML-RPC proxy, that sends requests with a shared aiohttp ClientSession."""
 
     def __init__(
         self,
-        max_workers: int,
         interface_id: str,
         connection_state: hmcu.CentralConnectionState,
-        *args: Any,
-        **kwargs: Any,
+        get_client_session: Callable[[], ClientSession],
+        uri: str,
+        headers: list[tuple[str, str]],
+        tls: bool = False,
+        verify_tls: bool = True,
+        serialize_requests: bool = False,
     ) -> None:
-        """Initialize new proxy for server and get local ip."""
-        self._tasks: Final[set[asyncio.Future[Any]]] = set()
+        """Initialize new proxy for server."""
         self.interface_id: Final = interface_id
         self._connection_state: Final = connection_state
-        self._loop: Final = asyncio.get_running_loop()
-        self._proxy_executor: Final = (
-            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=interface_id)
-            if max_workers > 0
-            else None
-        )
-        self._tls: Final[bool] = kwargs.pop(_TLS, False)
-        self._verify_tls: Final[bool] = kwargs.pop(_VERIFY_TLS, True)
-        if self._tls:
-            kwargs[_CONTEXT] = get_tls_context(self._verify_tls)
-        xmlrpc.client.ServerProxy.__init__(  # type: ignore[misc]
-            self, encoding=_ENCODING_ISO_8859_1, *args, **kwargs
+        # The session is requested per call, so it is only created when needed
+        # and recreated after the central has closed it.
+        self._get_client_session: Final = get_client_session
+        self._uri: Final = uri
+        self._headers: Final[dict[str, str]] = {**_HEADERS, **dict(headers)}
+        self._ssl: Final = get_tls_context(verify_tls) if tls else True
+        # The backend must receive write requests in the order they were sent,
+        # so only one request of a serialized proxy is in flight at a time.
+        self._request_lock: Final = asyncio.Lock() if serialize_requests else None
+
+    async def _post(self, method: str, params: tuple[Any, ...]) -> Any:
+        """Send a XML-RPC request and return the unmarshalled result."""
+        payload = xmlrpc.client.dumps(params, method, encoding=_ENCODING_ISO_8859_1).encode(
+            _ENCODING_ISO_8859_1, "xmlcharrefreplace"
         )
-
-    def _async_add_proxy_executor_job(
-        self, func: Callable[..., _T], *args: Any
-    ) -> asyncio.Future[_T]:
-        """Add an executor job from within the event_loop for all device related interaction."""
-        task = self._loop.run_in_executor(self._proxy_executor, func, *args)
-        self._tasks.add(task)
-        task.add_done_callback(self._tasks.remove)
-        return task
+        async with self._get_client_session().post(
+            self._uri,
+            data=payload,
+            headers=self._headers,
+            timeout=_get_client_timeout(method=method),
+            ssl=self._ssl,
+        ) as response:
+            if response.status != 200:
+                raise xmlrpc.client.ProtocolError(
+                    self._uri, response.status, response.reason or "", dict(response.headers)
+                )
+            parser, unmarshaller = xmlrpc.client.getparser()
+            parser.feed(await response.read())
+            parser.close()
+        result = unmarshaller.close()
+        return result[0] if len(result) == 1 else result
 
     async def __async_request(self, *args, **kwargs):  # type: ignore[no-untyped-def]
         """Call method on server side."""
-        parent = xmlrpc.client.ServerProxy
         try:
             if args[
                 0
@@ -92,25 +109,31 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
             ):
                 args = _cleanup_args(*args)
                 _LOGGER.debug("__ASYNC_REQUEST: %s", args)
-                result = await self._async_add_proxy_executor_job(
-                    # pylint: disable=protected-access
-                    parent._ServerProxy__request,  # type: ignore[attr-defined]
-                    self,
-                    *args,
-                )
+                if self._request_lock is None:
+                    result = await self._post(*args)
+                else:
+                    async with self._request_lock:
+                        result = await self._post(*args)
                 self._connection_state.remove_issue(issuer=self)
                 return result
             raise NoConnection(f"No connection to {self.interface_id}")
         except SSLError as sslerr:
             message = f"SSLError on {self.interface_id}: {reduce_args(args=sslerr.args)}"
-            if sslerr.args[0] in _SSL_ERROR_CODES:
+            if sslerr.args and sslerr.args[0] in _SSL_ERROR_CODES:
                 _LOGGER.debug(message)
             else:
                 _LOGGER.error(message)
             raise NoConnection(message) from sslerr
+        except TimeoutError as terr:
+            message = f"Timeout on {self.interface_id}"
+            if self._connection_state.add_issue(issuer=self):
+                _LOGGER.error(message)
+            else:
+                _LOGGER.debug(message)
+            raise NoConnection(message) from terr
         except OSError as ose:
-            message = f"OSError on {self.interface_id}: {reduce_args(args=ose.args)}"
-            if ose.args[0] in _NO_CONNECTION_ERROR_CODES:
+            message = f"OSError on {self.interface_id}: {ose}"
+            if ose.errno in _NO_CONNECTION_ERROR_CODES:
                 if self._connection_state.add_issue(issuer=self):
                     _LOGGER.error(message)
                 else:
@@ -118,6 +141,13 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
             else:
                 _LOGGER.error(message)
             raise NoConnection(message) from ose
+        except ClientConnectionError as cce:
+            message = f"Connection error on {self.interface_id}: {reduce_args(args=cce.args)}"
+            if self._connection_state.add_issue(issuer=self):
+                _LOGGER.error(message)
+            else:
+                _LOGGER.debug(message)
+            raise NoConnection(message) from cce
         except xmlrpc.client.Fault as fex:
             raise ClientException(fex) from fex
         except TypeError as terr:
@@ -134,12 +164,22 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
 
     def __getattr__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
         """Magic method dispatcher."""
+        if args[0].startswith("_"):
+            raise AttributeError(args[0])
         return xmlrpc.client._Method(self.__async_request, *args, **kwargs)
 
-    def stop(self) -> None:
-        """Stop depending services."""
-        if self._proxy_executor:
-            self._proxy_executor.shutdown()
+
+def _get_client_timeout(method: str) -> ClientTimeout:
+    """
+    Return the timeout for a XML-RPC command.
+
+    There is no total timeout, because requests might wait for a free connection of the pool.
+    Only the connect and the wait for data are limited, and long running commands
+    are only limited on connect.
+    """
+    if method in _LONG_RUNNING_XMLRPC_COMMANDS:
+        return ClientTimeout(total=None, sock_connect=config.TIMEOUT)
+    return ClientTimeout(total=None, sock_connect=config.TIMEOUT, sock_read=config.TIMEOUT)
 
 
 def _cleanup_args(*args: Any) -> Any:
@@ -48,9 +48,6 @@ class ClientLocal(Client):  # pragma: no cover
         """De-init to stop CCU from sending events for this remote."""
         return HmProxyInitState.DE_INIT_SUCCESS
 
-    def stop(self) -> None:
-        """Stop depending services."""
-
     async def fetch_all_device_data(self) -> None:
         """Fetch all device data from CCU."""
 
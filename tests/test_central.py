@@ -1,23 +1,32 @@
 """Test the HaHomematic central."""
 from __future__ import annotations
 
+import asyncio
 from contextlib import suppress
+from datetime import datetime, timedelta
+import time
 from typing import cast
-from unittest.mock import call, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
 
-from hahomematic.config import PING_PONG_MISMATCH_COUNT
+from hahomematic.client import ClientCCU, InterfaceConfig, _ClientConfig
+from hahomematic.config import PARAMSET_FETCH_CONCURRENCY, PING_PONG_MISMATCH_COUNT
 from hahomematic.const import (
     EVENT_AVAILABLE,
+    INIT_DATETIME,
+    INIT_TIMESTAMP,
+    HmDataOperationResult,
+    HmDescription,
     HmEntityUsage,
     HmEvent,
     HmEventType,
     HmInterfaceEventType,
+    HmInterfaceName,
     HmParamsetKey,
     HmPlatform,
 )
-from hahomematic.exceptions import HaHomematicException, NoClients
+from hahomematic.exceptions import HaHomematicException, NoClients, NoConnection
 from hahomematic.platforms.generic.number import HmFloat
 from hahomematic.platforms.generic.switch import HmSwitch
 
@@ -295,29 +304,29 @@ async def test_central_services(factory: helper.Factory) -> None:
     await central.fetch_sysvar_data()
     assert mock_client.method_calls[-1] == call.get_all_system_variables(include_internal=True)
 
-    assert len(mock_client.method_calls) == 37
+    assert len(mock_client.method_calls) == 18
     await central.load_and_refresh_entity_data(paramset_key=HmParamsetKey.MASTER)
-    assert len(mock_client.method_calls) == 37
+    assert len(mock_client.method_calls) == 18
     await central.load_and_refresh_entity_data(paramset_key=HmParamsetKey.VALUES)
-    assert len(mock_client.method_calls) == 70
+    assert len(mock_client.method_calls) == 51
 
     await central.get_system_variable(name="SysVar_Name")
     assert mock_client.method_calls[-1] == call.get_system_variable("SysVar_Name")
 
-    assert len(mock_client.method_calls) == 71
+    assert len(mock_client.method_calls) == 52
     await central.set_system_variable(name="sv_alarm", value=True)
     assert mock_client.method_calls[-1] == call.set_system_variable(name="sv_alarm", value=True)
-    assert len(mock_client.method_calls) == 72
+    assert len(mock_client.method_calls) == 53
     await central.set_system_variable(name="SysVar_Name", value=True)
-    assert len(mock_client.method_calls) == 72
+    assert len(mock_client.method_calls) == 53
 
     await central.set_install_mode(interface_id=const.INTERFACE_ID)
     assert mock_client.method_calls[-1] == call.set_install_mode(
         on=True, t=60, mode=1, device_address=None
     )
-    assert len(mock_client.method_calls) == 73
+    assert len(mock_client.method_calls) == 54
     await central.set_install_mode(interface_id="NOT_A_VALID_INTERFACE_ID")
-    assert len(mock_client.method_calls) == 73
+    assert len(mock_client.method_calls) == 54
 
     await central.get_client(interface_id=const.INTERFACE_ID).set_value(
         channel_address="123",
@@ -331,7 +340,7 @@ async def test_central_services(factory: helper.Factory) -> None:
         parameter="LEVEL",
         value=1.0,
     )
-    assert len(mock_client.method_calls) == 74
+    assert len(mock_client.method_calls) == 55
 
     with pytest.raises(HaHomematicException):
         await central.get_client(interface_id="NOT_A_VALID_INTERFACE_ID").set_value(
@@ -340,7 +349,7 @@ async def test_central_services(factory: helper.Factory) -> None:
             parameter="LEVEL",
             value=1.0,
         )
-    assert len(mock_client.method_calls) == 74
+    assert len(mock_client.method_calls) == 55
 
     await central.get_client(interface_id=const.INTERFACE_ID).put_paramset(
         address="123",
@@ -350,14 +359,14 @@ async def test_central_services(factory: helper.Factory) -> None:
     assert mock_client.method_calls[-1] == call.put_paramset(
         address="123", paramset_key="VALUES", value={"LEVEL": 1.0}
     )
-    assert len(mock_client.method_calls) == 75
+    assert len(mock_client.method_calls) == 56
     with pytest.raises(HaHomematicException):
         await central.get_client(interface_id="NOT_A_VALID_INTERFACE_ID").put_paramset(
             address="123",
             paramset_key=HmParamsetKey.VALUES,
             value={"LEVEL": 1.0},
         )
-    assert len(mock_client.method_calls) == 75
+    assert len(mock_client.method_calls) == 56
 
     assert (
         central.get_generic_entity(
@@ -368,6 +377,22 @@ async def test_central_services(factory: helper.Factory) -> None:
     assert central.get_generic_entity(channel_address="VCU6354483", parameter="DUTY_CYCLE") is None
 
 
+@pytest.mark.asyncio
+async def test_central_set_system_variables(factory: helper.Factory) -> None:
+    """Test central set multiple system variables."""
+    central, mock_client = await factory.get_default_central(
+        TEST_DEVICES, add_programs=True, add_sysvars=True
+    )
+    await central.fetch_sysvar_data()
+    call_count = len(mock_client.method_calls)
+    await central.set_system_variables(
+        values={"sv_alarm": True, "sv_logic": False, "NOT_A_SYSVAR": True}
+    )
+    assert len(mock_client.method_calls) == call_count + 2
+    assert call.set_system_variable(name="sv_alarm", value=True) in mock_client.method_calls
+    assert call.set_system_variable(name="sv_logic", value=False) in mock_client.method_calls
+
+
 @pytest.mark.asyncio
 async def test_central_direct(factory: helper.Factory) -> None:
     """Test central other methods."""
@@ -390,6 +415,57 @@ async def test_central_direct(factory: helper.Factory) -> None:
     await central.stop()
 
 
+@pytest.mark.asyncio
+async def test_central_stop_saves_scheduled_paramset_descriptions(
+    factory: helper.Factory,
+) -> None:
+    """Test that stopping the central runs a pending debounced save."""
+    central, client = await factory.get_unpatched_default_central(
+        TEST_DEVICES, do_mock_client=False
+    )
+    mock_client = helper.get_mock(instance=client)
+    with patch("hahomematic.client.create_client", return_value=mock_client):
+        await central.start()
+
+    paramset_descriptions = central.paramset_descriptions
+    paramset_descriptions.save_debounced(delay=60)
+    assert paramset_descriptions._scheduled_save is not None
+    with patch.object(
+        paramset_descriptions, "save", wraps=paramset_descriptions.save
+    ) as mock_save:
+        await central.stop()
+    mock_save.assert_awaited_once()
+    assert paramset_descriptions._scheduled_save is None
+
+
+@pytest.mark.asyncio
+async def test_save_scheduled_awaits_running_save(factory: helper.Factory) -> None:
+    """Test that a debounced save, that is already running, is awaited."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    paramset_descriptions = central.paramset_descriptions
+    # Replace a save, that has been scheduled by the central start.
+    paramset_descriptions._cancel_scheduled_save()
+    saving = asyncio.Event()
+
+    async def _save() -> HmDataOperationResult:
+        await saving.wait()
+        return HmDataOperationResult.SAVE_SUCCESS
+
+    with patch.object(paramset_descriptions, "save", side_effect=_save) as mock_save:
+        paramset_descriptions.save_debounced(delay=0)
+        for _ in range(10):
+            if paramset_descriptions._save_task is not None:
+                break
+            await asyncio.sleep(0)
+        assert paramset_descriptions._scheduled_save is None
+        assert paramset_descriptions._save_task is not None
+        asyncio.get_running_loop().call_soon(saving.set)
+        assert await paramset_descriptions.save_scheduled() == HmDataOperationResult.SAVE_SUCCESS
+        mock_save.assert_awaited_once()
+    assert paramset_descriptions._save_task is None
+    assert await paramset_descriptions.save_scheduled() == HmDataOperationResult.NO_SAVE
+
+
 @pytest.mark.asyncio
 async def test_central_without_interface_config(factory: helper.Factory) -> None:
     """Test central other methods."""
@@ -430,6 +506,104 @@ async def test_ping_pong(factory: helper.Factory) -> None:
     assert central._ping_count[interface_id] == 0
 
 
+@pytest.mark.asyncio
+async def test_client_last_updated(factory: helper.Factory) -> None:
+    """Test that events stamp the last update of the client."""
+    central, client = await factory.get_default_central(TEST_DEVICES, do_mock_client=False)
+    client.last_updated_monotonic = INIT_TIMESTAMP
+    assert client.last_updated == INIT_DATETIME
+    central.event(client.interface_id, "VCU2128127:1", "STATE", 1)
+    assert client.last_updated_monotonic != INIT_TIMESTAMP
+    assert datetime.now() - client.last_updated < timedelta(seconds=1)
+
+
+async def _get_client_ccu(factory: helper.Factory) -> ClientCCU:
+    """Return a CCU client, that is not connected to a backend."""
+    interface_config = InterfaceConfig(
+        central_name=const.CENTRAL_NAME,
+        interface=HmInterfaceName.BIDCOS_RF,
+        port=2002,
+    )
+    central = await factory.get_raw_central(interface_config=interface_config)
+    return ClientCCU(
+        client_config=_ClientConfig(
+            central=central, interface_config=interface_config, local_ip="127.0.0.1"
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_client_limits_paramset_description_requests(factory: helper.Factory) -> None:
+    """Test that a client limits its concurrent paramset description requests."""
+    client = await _get_client_ccu(factory)
+    stats = {"active": 0, "max_active": 0}
+
+    async def get_paramset_description(address: str, paramset_key: str) -> dict:
+        stats["active"] += 1
+        stats["max_active"] = max(stats["max_active"], stats["active"])
+        await asyncio.sleep(0.01)
+        stats["active"] -= 1
+        return {}
+
+    client._proxy_read = Mock(getParamsetDescription=get_paramset_description)
+    device_descriptions = [
+        {
+            HmDescription.ADDRESS: f"VCU0000001:{channel_no}",
+            HmDescription.PARENT_TYPE: "HmIP-BSM",
+            HmDescription.PARAMSETS: [HmParamsetKey.MASTER, HmParamsetKey.VALUES],
+        }
+        for channel_no in range(1, 21)
+    ]
+    paramsets = await client.get_all_paramset_descriptions(device_descriptions=device_descriptions)
+    assert len(paramsets) == 20
+    assert stats["max_active"] == PARAMSET_FETCH_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_client_paramset_descriptions_without_paramsets(factory: helper.Factory) -> None:
+    """Test a channel without paramsets, that has no parent type."""
+    client = await _get_client_ccu(factory)
+    client._proxy_read = Mock()
+    assert await client.get_paramset_descriptions(
+        device_description={HmDescription.ADDRESS: "VCU0000001:1", HmDescription.PARAMSETS: []}
+    ) == {"VCU0000001:1": {}}
+    assert client._proxy_read.method_calls == []
+
+
+@pytest.mark.asyncio
+async def test_client_skips_ping_after_request(factory: helper.Factory) -> None:
+    """Test that a recent successful request replaces the ping of the connection check."""
+    client = await _get_client_ccu(factory)
+    client._proxy = AsyncMock()
+    # An event is no proof, that the backend accepts requests.
+    client.last_updated_monotonic = time.monotonic()
+    assert await client.is_connected() is True
+    assert client._proxy.ping.await_count == 1
+    assert await client.is_connected() is True
+    assert client._proxy.ping.await_count == 1
+
+    client._last_request_monotonic = INIT_TIMESTAMP
+    assert await client.set_value(
+        channel_address="VCU0000001:1",
+        paramset_key=HmParamsetKey.VALUES,
+        parameter="STATE",
+        value=True,
+    )
+    assert await client.is_connected() is True
+    assert client._proxy.ping.await_count == 1
+
+    client._proxy.setValue.side_effect = NoConnection("test")
+    client._last_request_monotonic = INIT_TIMESTAMP
+    assert not await client.set_value(
+        channel_address="VCU0000001:1",
+        paramset_key=HmParamsetKey.VALUES,
+        parameter="STATE",
+        value=True,
+    )
+    assert await client.is_connected() is True
+    assert client._proxy.ping.await_count == 2
+
+
 @pytest.mark.asyncio
 async def test_ping_failure(factory: helper.Factory) -> None:
     """Test central other methods."""
@@ -2,17 +2,23 @@
 from __future__ import annotations
 
 from typing import cast
-from unittest.mock import MagicMock, call
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
 from hahomematic.caches.visibility import check_ignore_parameters_is_clean
 from hahomematic.const import HmCallSource, HmEntityUsage
+from hahomematic.platforms.custom import definition as hmed
 from hahomematic.platforms.custom.definition import (
+    entity_definition_exists,
+    get_entity_configs,
     get_required_parameters,
+    register_devices,
     validate_entity_definition,
 )
+from hahomematic.platforms.custom.support import CustomConfig
 from hahomematic.platforms.custom.switch import CeSwitch
+from hahomematic.platforms.entity import CallParameterCollector
 from hahomematic.platforms.generic.sensor import HmSensor
 from hahomematic.platforms.generic.switch import HmSwitch
 
@@ -31,6 +37,24 @@ def test_validate_entity_definition() -> None:
     assert validate_entity_definition() is not None
 
 
+def test_register_devices() -> None:
+    """Test that registered devices replace the cached entity configs."""
+    assert entity_definition_exists("HmIP-TEST") is False
+    custom_config = CustomConfig(func=MagicMock(), channels=(1,))
+    devices: dict[str, CustomConfig | tuple[CustomConfig, ...]] = {"HmIP-TEST": custom_config}
+    register_devices(devices=devices, blacklisted_devices=("HmIP-TEST-BL",))
+    try:
+        assert get_entity_configs("HmIP-TEST") == [custom_config]
+        assert get_entity_configs("HmIP-TEST-BL") == []
+        # A returned list does not change the cached entity configs.
+        get_entity_configs("HmIP-TEST").clear()
+        assert entity_definition_exists("HmIP-TEST") is True
+    finally:
+        hmed.ALL_DEVICES.remove(devices)
+        hmed.ALL_BLACKLISTED_DEVICES.remove(("HmIP-TEST-BL",))
+        hmed._get_entity_configs.cache_clear()
+
+
 @pytest.mark.asyncio
 async def test_custom_entity_callback(factory: helper.Factory) -> None:
     """Test CeSwitch."""
@@ -111,6 +135,49 @@ async def test_generic_entity_callback(factory: helper.Factory) -> None:
     device_removed_mock.assert_called_with()
 
 
+@pytest.mark.asyncio
+async def test_generic_entity_unchanged_value(factory: helper.Factory) -> None:
+    """Test that an unchanged value doesn't trigger the update callbacks."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    switch: HmSwitch = cast(HmSwitch, central.get_generic_entity("VCU2128127:4", "STATE"))
+    device_updated_mock = MagicMock()
+    switch.register_update_callback(device_updated_mock)
+
+    switch.update_value(value=True)
+    assert switch.value is True
+    assert switch.state_uncertain is False
+    assert device_updated_mock.call_count == 1
+    last_update = switch.last_update
+
+    switch.update_value(value=True)
+    assert device_updated_mock.call_count == 1
+    assert switch.last_update >= last_update
+
+    switch.update_value(value=False)
+    assert switch.value is False
+    assert device_updated_mock.call_count == 2
+    switch.unregister_update_callback(device_updated_mock)
+
+
+@pytest.mark.asyncio
+async def test_call_parameter_collector_stops_on_failed_channel(factory: helper.Factory) -> None:
+    """Test that the collector stops sending at the first failed channel."""
+    central, mock_client = await factory.get_default_central(TEST_DEVICES)
+    collector = CallParameterCollector(client=mock_client)
+    collector.add_entity(entity=central.get_generic_entity("VCU2128127:4", "STATE"), value=True)
+    collector.add_entity(entity=central.get_generic_entity("VCU2128127:3", "STATE"), value=True)
+    with patch.object(mock_client, "set_value", AsyncMock(return_value=False)) as set_value:
+        assert await collector.send_data() is False
+    assert set_value.await_args_list == [
+        call(
+            channel_address="VCU2128127:4",
+            paramset_key="VALUES",
+            parameter="STATE",
+            value=True,
+        )
+    ]
+
+
 @pytest.mark.asyncio
 async def test_load_custom_entity(factory: helper.Factory) -> None:
     """Test load custom_entity."""
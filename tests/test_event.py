@@ -5,6 +5,7 @@ from typing import cast
 from unittest.mock import call
 
 import pytest
+import voluptuous as vol
 
 from hahomematic.const import HmEntityUsage, HmEventType
 from hahomematic.platforms.event import ClickEvent, DeviceErrorEvent, ImpulseEvent
@@ -40,6 +41,21 @@ async def test_clickevent(factory: helper.Factory) -> None:
     )
 
 
+@pytest.mark.asyncio
+async def test_event_data_validation(factory: helper.Factory) -> None:
+    """Test that invalid event data is rejected."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    event: ClickEvent = cast(ClickEvent, central.get_event("VCU2128127:1", "PRESS_SHORT"))
+    assert event.get_event_data(value=1)["value"] == 1
+    with pytest.raises(vol.Invalid):
+        event.get_event_data(value=1.5)
+    with pytest.raises(vol.Invalid):
+        event.get_event_data(value="PRESSED")
+    event._attr_channel_no = None
+    with pytest.raises(vol.Invalid):
+        event.get_event_data(value=True)
+
+
 @pytest.mark.asyncio
 async def test_impulseevent(factory: helper.Factory) -> None:
     """Test ImpulseEvent."""
@@ -1,11 +1,23 @@
 """Tests for json rpc client of hahomematic."""
 from __future__ import annotations
 
+import asyncio
 import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import orjson
 import pytest
 
+from hahomematic.central_unit import CentralConnectionState
+from hahomematic.json_rpc_client import (
+    JsonRpcAioHttpClient,
+    _convert_to_values_cache,
+    _get_script_variable_pattern,
+)
+
+# pylint: disable=protected-access
+
 SUCCESS = '{"HmIP-RF.0001D3C99C3C93%3A0.CONFIG_PENDING":false,\r\n"VirtualDevices.INT0000001%3A1.SET_POINT_TEMPERATURE":4.500000,\r\n"VirtualDevices.INT0000001%3A1.SWITCH_POINT_OCCURED":false,\r\n"VirtualDevices.INT0000001%3A1.VALVE_STATE":4,\r\n"VirtualDevices.INT0000001%3A1.WINDOW_STATE":0,\r\n"HmIP-RF.001F9A49942EC2%3A0.CARRIER_SENSE_LEVEL":10.000000,\r\n"HmIP-RF.0003D7098F5176%3A0.UNREACH":false,\r\n"BidCos-RF.OEQ1860891%3A0.UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A0.STICKY_UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A1.INHIBIT":false,\r\n"HmIP-RF.000A570998B3FB%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A570998B3FB%3A0.UPDATE_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.UPDATE_PENDING":false,\r\n"BidCos-RF.NEQ1636407%3A1.STATE":0,\r\n"BidCos-RF.NEQ1636407%3A2.STATE":false,\r\n"BidCos-RF.NEQ1636407%3A2.INHIBIT":false,\r\n"CUxD.CUX2800001%3A12.TS":"0"}'
 FAILURE = '{"HmIP-RF.0001D3C99C3C93%3A0.CONFIG_PENDING":false,\r\n"VirtualDevices.INT0000001%3A1.SET_POINT_TEMPERATURE":4.500000,\r\n"VirtualDevices.INT0000001%3A1.SWITCH_POINT_OCCURED":false,\r\n"VirtualDevices.INT0000001%3A1.VALVE_STATE":4,\r\n"VirtualDevices.INT0000001%3A1.WINDOW_STATE":0,\r\n"HmIP-RF.001F9A49942EC2%3A0.CARRIER_SENSE_LEVEL":10.000000,\r\n"HmIP-RF.0003D7098F5176%3A0.UNREACH":false,\r\n,\r\n,\r\n"BidCos-RF.OEQ1860891%3A0.UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A0.STICKY_UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A1.INHIBIT":false,\r\n"HmIP-RF.000A570998B3FB%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A570998B3FB%3A0.UPDATE_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.UPDATE_PENDING":false,\r\n"BidCos-RF.NEQ1636407%3A1.STATE":0,\r\n"BidCos-RF.NEQ1636407%3A2.STATE":false,\r\n"BidCos-RF.NEQ1636407%3A2.INHIBIT":false,\r\n"CUxD.CUX2800001%3A12.TS":"0"}'
 
@@ -19,3 +31,191 @@ def test_convert_to_json_fails() -> None:
     """Test if convert to json is successful."""
     with pytest.raises(json.JSONDecodeError):
         orjson.loads(FAILURE)
+
+
+def test_convert_to_values_cache() -> None:
+    """Test the conversion of all device data to the values cache."""
+    values_cache = _convert_to_values_cache(orjson.loads(SUCCESS))
+    assert values_cache[("BidCos-RF", "OEQ1860891:0", "UNREACH")] is True
+    assert values_cache[("BidCos-RF", "OEQ1860891:0", "STICKY_UNREACH")] is True
+    assert values_cache[("VirtualDevices", "INT0000001:1", "SET_POINT_TEMPERATURE")] == 4.5
+    assert values_cache[("CUxD", "CUX2800001:12", "TS")] == "0"
+
+
+async def test_get_json_response_workaround() -> None:
+    """Test that invalid escapes from the CCU are removed from the raw body."""
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+    )
+    response = MagicMock()
+    response.read = AsyncMock(return_value=b'{"result": "ab\\c", "error": null}')
+    assert await json_rpc_client._get_json_reponse(response=response) == {
+        "result": "abc",
+        "error": None,
+    }
+    response.read.assert_awaited_once()
+
+
+def test_session_updated_within_seconds() -> None:
+    """Test the monotonic session age check."""
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+    )
+    assert json_rpc_client._updated_within_seconds() is False
+    json_rpc_client._last_session_id_refresh = time.monotonic()
+    assert json_rpc_client._updated_within_seconds() is True
+    json_rpc_client._last_session_id_refresh = time.monotonic() - 86400 - 10
+    assert json_rpc_client._updated_within_seconds() is False
+
+
+async def test_concurrent_login_is_shared() -> None:
+    """Test that concurrent calls share one login request."""
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+    )
+    login_calls = 0
+
+    async def _do_login() -> str:
+        nonlocal login_calls
+        login_calls += 1
+        await asyncio.sleep(0.01)
+        return "session_id"
+
+    with patch.object(json_rpc_client, "_do_login", side_effect=_do_login):
+        results = await asyncio.gather(*[json_rpc_client._login_or_renew() for _ in range(5)])
+        assert all(results)
+        assert login_calls == 1
+        assert await json_rpc_client._login_or_renew() is True
+        assert login_calls == 1
+
+
+def test_script_variable_substitution() -> None:
+    """Test that all script variables are substituted in a single pass."""
+    variables = {"name": "##value##", "value": "1.0"}
+    pattern = _get_script_variable_pattern(variables=frozenset(variables))
+    assert (
+        pattern.sub(lambda match: variables[match.group(1)], "##name##=##value##;##other##")
+        == "##value##=1.0;##other##"
+    )
+
+
+async def test_backend_info_is_cached() -> None:
+    """Test that concurrent calls fetch the backend information only once."""
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+    )
+    with patch.object(
+        json_rpc_client, "_post", AsyncMock(return_value={"result": True, "error": None})
+    ) as post:
+        results = await asyncio.gather(*[json_rpc_client.get_auth_enabled() for _ in range(3)])
+        assert results == [True, True, True]
+        assert post.await_count == 1
+    with patch.object(
+        json_rpc_client,
+        "_post_script",
+        AsyncMock(return_value={"result": {"serial": "0123456789ABC"}, "error": None}),
+    ) as post_script:
+        assert await json_rpc_client.get_serial() == "3456789ABC"
+        assert await json_rpc_client.get_serial() == "3456789ABC"
+        assert post_script.await_count == 1
+        # A cleared session invalidates the cached backend information.
+        json_rpc_client.clear_session()
+        assert await json_rpc_client.get_serial() == "3456789ABC"
+        assert post_script.await_count == 2
+
+
+async def test_backend_info_is_locked_per_key() -> None:
+    """Test that a pending fetch does not block other backend information."""
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+    )
+    release = asyncio.Event()
+
+    async def _post_script(**kwargs: str) -> dict[str, dict[str, str] | None]:
+        await release.wait()
+        return {"result": {"serial": "0123456789ABC"}, "error": None}
+
+    with patch.object(json_rpc_client, "_post_script", _post_script), patch.object(
+        json_rpc_client, "_post", AsyncMock(return_value={"result": True, "error": None})
+    ):
+        serial_task = asyncio.create_task(json_rpc_client.get_serial())
+        await asyncio.sleep(0)
+        assert await asyncio.wait_for(json_rpc_client.get_auth_enabled(), timeout=1) is True
+        release.set()
+        assert await serial_task == "3456789ABC"
+
+
+def test_get_script() -> None:
+    """Test loading of ReGa scripts."""
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+    )
+    assert json_rpc_client._get_script(script_name="get_serial.fn")
+    assert json_rpc_client._get_script(script_name="not_existing.fn") is None
+
+
+async def test_concurrent_posts_share_one_session() -> None:
+    """Test that concurrent requests are pipelined over one login."""
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+    )
+    with patch.object(
+        json_rpc_client, "_do_login", AsyncMock(return_value="session_id")
+    ) as do_login, patch.object(
+        json_rpc_client, "_do_post", AsyncMock(return_value={"result": True, "error": None})
+    ) as do_post:
+        results = await asyncio.gather(
+            *[
+                json_rpc_client.set_system_variable(name=f"sv_{i}", value=float(i))
+                for i in range(5)
+            ]
+        )
+        assert all(results)
+        assert do_login.await_count == 1
+        assert do_post.await_count == 5
+        assert {call.kwargs["session_id"] for call in do_post.await_args_list} == {"session_id"}
+
+
+@pytest.mark.parametrize(
+    ("json_result", "expected"),
+    [
+        ("true", True),
+        ("false", False),
+        ("1.5", 1.5),
+        ("-3", -3.0),
+        ("text", False),
+    ],
+)
+async def test_get_system_variable(json_result: str, expected: bool | float) -> None:
+    """Test the type coercion of a single system variable."""
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+    )
+    with patch.object(
+        json_rpc_client, "_post", AsyncMock(return_value={"result": json_result, "error": None})
+    ):
+        assert await json_rpc_client.get_system_variable(name="sv") == expected
@@ -23,6 +23,8 @@ from hahomematic.platforms.custom.light import (
     CeDimmer,
     CeIpFixedColorLight,
     CeIpRGBWLight,
+    _convert_color,
+    _recalc_unit_timer,
 )
 
 from tests import const, helper
@@ -339,6 +341,42 @@ async def test_cecolortempdimmer(factory: helper.Factory) -> None:
     )
     assert light.color_temp == 433
 
+    # The device reports a rounded color level, that is no change for the same mireds.
+    central.event(const.INTERFACE_ID, "VCU0000115:2", "LEVEL", 0.193)
+    await light.turn_on(color_temp=433, brightness=128)
+    assert mock_client.method_calls[-2] != call.set_value(
+        channel_address="VCU0000115:2",
+        paramset_key="VALUES",
+        parameter="LEVEL",
+        value=0.1930835734870317,
+    )
+    assert mock_client.method_calls[-1] == call.set_value(
+        channel_address="VCU0000115:1",
+        paramset_key="VALUES",
+        parameter="LEVEL",
+        value=0.5019607843137255,
+    )
+    await light.turn_on(color_temp=432)
+    assert mock_client.method_calls[-2] == call.set_value(
+        channel_address="VCU0000115:2",
+        paramset_key="VALUES",
+        parameter="LEVEL",
+        value=0.19596541786743515,
+    )
+    assert light.color_temp == 432
+
+    # An uncertain state of the device is no reason to skip the same color level.
+    central.event(const.INTERFACE_ID, "VCU0000115:2", "LEVEL", 0.19596541786743515)
+    light._e_color_level._attr_state_uncertain = True
+    await light.turn_on(color_temp=432)
+    assert mock_client.method_calls[-2] == call.set_value(
+        channel_address="VCU0000115:2",
+        paramset_key="VALUES",
+        parameter="LEVEL",
+        value=0.19596541786743515,
+    )
+    light._e_color_level._attr_state_uncertain = False
+
     await light.turn_on()
     call_count = len(mock_client.method_calls)
     await light.turn_on()
@@ -814,6 +852,13 @@ async def test_ceiprgbwlight(factory: helper.Factory) -> None:
         value={"COLOR_TEMPERATURE": 3333, "LEVEL": 1.0},
     )
     assert light.color_temp == 300
+    await light.turn_on(color_temp=153)
+    assert mock_client.method_calls[-1] == call.put_paramset(
+        address="VCU5629873:1",
+        paramset_key="VALUES",
+        value={"COLOR_TEMPERATURE": 6536, "LEVEL": 1.0},
+    )
+    assert light.color_temp == 153
 
     await light.turn_on()
     call_count = len(mock_client.method_calls)
@@ -842,7 +887,62 @@ async def test_ceiprgbwlight(factory: helper.Factory) -> None:
     )
     assert light.hs_color == (0.0, 50.0)
 
+    await light.turn_on(hs_color=(0, 80))
+    assert mock_client.method_calls[-1] == call.put_paramset(
+        address="VCU5629873:1",
+        paramset_key="VALUES",
+        value={"SATURATION": 0.8, "LEVEL": 1.0},
+    )
+    assert light.hs_color == (0.0, 80.0)
+
+    # The device reports a rounded saturation, that is no change for the same hs color.
+    central.event(const.INTERFACE_ID, "VCU5629873:1", "SATURATION", 0.801)
+    await light.turn_on(hs_color=(0, 80))
+    assert mock_client.method_calls[-1] == call.set_value(
+        channel_address="VCU5629873:1", paramset_key="VALUES", parameter="LEVEL", value=1.0
+    )
+
     await light.turn_on(effect="EFFECT_01_END_CURRENT_PROFILE")
     assert mock_client.method_calls[-1] == call.put_paramset(
         address="VCU5629873:1", paramset_key="VALUES", value={"EFFECT": 1, "LEVEL": 1.0}
     )
+
+
+@pytest.mark.parametrize(
+    ("hue", "expected"),
+    [
+        (0, _COLOR_RED),
+        (30, _COLOR_RED),
+        (31, _COLOR_YELLOW),
+        (90, _COLOR_YELLOW),
+        (91, _COLOR_GREEN),
+        (150, _COLOR_GREEN),
+        (151, _COLOR_TURQUOISE),
+        (210, _COLOR_TURQUOISE),
+        (211, _COLOR_BLUE),
+        (270, _COLOR_BLUE),
+        (271, _COLOR_PURPLE),
+        (330, _COLOR_PURPLE),
+        (331, _COLOR_RED),
+        (360, _COLOR_RED),
+    ],
+)
+def test_convert_color(hue: int, expected: str) -> None:
+    """Test the conversion of hue to the reduced device colors."""
+    assert _convert_color((hue, 100.0)) == expected
+    assert _convert_color((hue, 4.0)) == _COLOR_WHITE
+
+
+@pytest.mark.parametrize(
+    ("time", "expected"),
+    [
+        (0.5, (0.5, 0)),
+        (16343, (16343, 0)),
+        (16344, (16344 / 60, 1)),
+        (16343 * 60, (16343, 1)),
+        (16343 * 60 + 60, (16344 / 60, 2)),
+    ],
+)
+def test_recalc_unit_timer(time: float, expected: tuple[float, int]) -> None:
+    """Test the recalculation of timer value and unit."""
+    assert _recalc_unit_timer(time=time) == expected
@@ -292,6 +292,18 @@ async def test_updated_within_seconds() -> None:
         )
         is False
     )
+    assert (
+        updated_within_seconds(
+            last_update=(datetime.now() - timedelta(days=1, seconds=10)), max_age_seconds=60
+        )
+        is False
+    )
+    assert (
+        updated_within_seconds(
+            last_update=(datetime.now() + timedelta(seconds=10)), max_age_seconds=60
+        )
+        is False
+    )
     assert updated_within_seconds(last_update=INIT_DATETIME, max_age_seconds=60) is False
 
 
@@ -0,0 +1,215 @@
+"""Tests for xml rpc proxy of hahomematic."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any
+from unittest.mock import patch
+import xmlrpc.client
+
+from aiohttp import ClientSession, web
+import pytest
+
+from hahomematic import config
+from hahomematic.central_unit import CentralConnectionState
+from hahomematic.const import HmParamsetKey
+from hahomematic.exceptions import AuthFailure, ClientException, NoConnection
+from hahomematic.support import find_free_port
+from hahomematic.xml_rpc_proxy import XmlRpcProxy, _get_client_timeout
+
+# pylint: disable=protected-access, redefined-outer-name
+
+_INTERFACE_ID = "test-BidCos-RF"
+
+
+def _xml_response(value: Any) -> web.Response:
+    """Return a XML-RPC method response."""
+    return web.Response(
+        body=xmlrpc.client.dumps((value,), methodresponse=True),
+        content_type="text/xml",
+    )
+
+
+async def _handle_request(request: web.Request) -> web.StreamResponse:
+    """Handle a XML-RPC request like a backend."""
+    params, method = xmlrpc.client.loads(await request.read())
+    if method == "echo":
+        return _xml_response(
+            {
+                "authorization": request.headers.get("Authorization"),
+                "content_type": request.headers.get("Content-Type"),
+                "params": list(params),
+            }
+        )
+    if method == "fault":
+        return web.Response(
+            body=xmlrpc.client.dumps(
+                xmlrpc.client.Fault(-2, "Unknown instance"), methodresponse=True
+            ),
+            content_type="text/xml",
+        )
+    if method == "invalid":
+        return web.Response(body=b"<methodResponse><params>", content_type="text/xml")
+    if method == "unauthorized":
+        return web.Response(status=401, reason="Unauthorized")
+    if method == "error":
+        return web.Response(status=500, reason="Internal Server Error")
+    if method in ("slow", "init"):
+        await asyncio.sleep(0.5)
+        return _xml_response(True)
+    if method == "track":
+        stats = request.app["stats"]
+        stats["active"] += 1
+        stats["max_active"] = max(stats["max_active"], stats["active"])
+        await asyncio.sleep(0.05)
+        stats["active"] -= 1
+        return _xml_response(True)
+    if method == "disconnect":
+        assert request.transport
+        request.transport.close()
+        return _xml_response(True)
+    return _xml_response("")
+
+
+@pytest.fixture
+async def client_session() -> AsyncGenerator[ClientSession, None]:
+    """Return a client session."""
+    session = ClientSession()
+    yield session
+    await session.close()
+
+
+@pytest.fixture
+async def xml_rpc_proxy(aiohttp_server, client_session: ClientSession) -> XmlRpcProxy:
+    """Return a proxy connected to a local XML-RPC server."""
+    app = web.Application()
+    app.router.add_post("/", _handle_request)
+    server = await aiohttp_server(app)
+    return XmlRpcProxy(
+        interface_id=_INTERFACE_ID,
+        connection_state=CentralConnectionState(),
+        get_client_session=lambda: client_session,
+        uri=str(server.make_url("/")),
+        headers=[("Authorization", "Basic dGVzdDp0ZXN0")],
+    )
+
+
+def _has_issue(proxy: XmlRpcProxy) -> bool:
+    """Return if the proxy has a connection issue."""
+    return proxy._connection_state.has_issue(issuer=proxy)
+
+
+@pytest.mark.asyncio
+async def test_xml_rpc_proxy_request(xml_rpc_proxy: XmlRpcProxy) -> None:
+    """Test a successful request."""
+    result = await xml_rpc_proxy.echo("VCU2128127:1", HmParamsetKey.VALUES, {"LEVEL": 0.5})
+    assert result == {
+        "authorization": "Basic dGVzdDp0ZXN0",
+        "content_type": "text/xml",
+        "params": ["VCU2128127:1", "VALUES", {"LEVEL": 0.5}],
+    }
+    assert await xml_rpc_proxy.ping(_INTERFACE_ID) == ""
+    assert _has_issue(xml_rpc_proxy) is False
+
+
+@pytest.mark.asyncio
+async def test_xml_rpc_proxy_fault(xml_rpc_proxy: XmlRpcProxy) -> None:
+    """Test the mapping of faults and invalid responses."""
+    with pytest.raises(ClientException) as exc:
+        await xml_rpc_proxy.fault()
+    assert isinstance(exc.value.__cause__, xmlrpc.client.Fault)
+    with pytest.raises(ClientException):
+        await xml_rpc_proxy.invalid()
+    with pytest.raises(ClientException):
+        await xml_rpc_proxy.echo(object())
+    assert _has_issue(xml_rpc_proxy) is False
+
+
+@pytest.mark.asyncio
+async def test_xml_rpc_proxy_protocol_error(xml_rpc_proxy: XmlRpcProxy) -> None:
+    """Test the mapping of http errors."""
+    with pytest.raises(AuthFailure):
+        await xml_rpc_proxy.unauthorized()
+    with pytest.raises(NoConnection):
+        await xml_rpc_proxy.error()
+
+
+@pytest.mark.asyncio
+async def test_xml_rpc_proxy_timeout(xml_rpc_proxy: XmlRpcProxy) -> None:
+    """Test the mapping of timeouts."""
+    with patch.object(config, "TIMEOUT", 0.1):
+        with pytest.raises(NoConnection) as exc:
+            await xml_rpc_proxy.slow()
+        assert isinstance(exc.value.__cause__, TimeoutError)
+        assert _has_issue(xml_rpc_proxy) is True
+        # Only valid commands are sent while there is a connection issue.
+        with pytest.raises(NoConnection):
+            await xml_rpc_proxy.slow()
+        # Long running commands are not limited by the read timeout.
+        assert await xml_rpc_proxy.init("http://127.0.0.1:43439", _INTERFACE_ID) is True
+    assert _has_issue(xml_rpc_proxy) is False
+
+
+@pytest.mark.asyncio
+async def test_xml_rpc_proxy_disconnect(xml_rpc_proxy: XmlRpcProxy) -> None:
+    """Test the mapping of a closed connection."""
+    with pytest.raises(NoConnection):
+        await xml_rpc_proxy.disconnect()
+    assert _has_issue(xml_rpc_proxy) is True
+
+
+@pytest.mark.asyncio
+async def test_xml_rpc_proxy_connection_refused(client_session: ClientSession) -> None:
+    """Test the mapping of a refused connection."""
+    proxy = XmlRpcProxy(
+        interface_id=_INTERFACE_ID,
+        connection_state=CentralConnectionState(),
+        get_client_session=lambda: client_session,
+        uri=f"http://127.0.0.1:{find_free_port()}",
+        headers=[],
+    )
+    with pytest.raises(NoConnection) as exc:
+        await proxy.ping(_INTERFACE_ID)
+    assert isinstance(exc.value.__cause__, OSError)
+    assert _has_issue(proxy) is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("serialize_requests", "max_active"),
+    [
+        (False, 3),
+        (True, 1),
+    ],
+)
+async def test_xml_rpc_proxy_serialize_requests(
+    aiohttp_server, client_session: ClientSession, serialize_requests: bool, max_active: int
+) -> None:
+    """Test that a serialized proxy only sends one request at a time."""
+    app = web.Application()
+    app["stats"] = stats = {"active": 0, "max_active": 0}
+    app.router.add_post("/", _handle_request)
+    server = await aiohttp_server(app)
+    proxy = XmlRpcProxy(
+        interface_id=_INTERFACE_ID,
+        connection_state=CentralConnectionState(),
+        get_client_session=lambda: client_session,
+        uri=str(server.make_url("/")),
+        headers=[],
+        serialize_requests=serialize_requests,
+    )
+    assert await asyncio.gather(proxy.track(), proxy.track(), proxy.track()) == [True] * 3
+    assert stats["max_active"] == max_active
+
+
+def test_get_client_timeout() -> None:
+    """Test the timeouts of the XML-RPC commands."""
+    timeout = _get_client_timeout(method="getValue")
+    assert timeout.total is None
+    assert timeout.sock_connect == config.TIMEOUT
+    assert timeout.sock_read == config.TIMEOUT
+    for method in ("init", "installFirmware", "listDevices", "updateFirmware"):
+        timeout = _get_client_timeout(method=method)
+        assert timeout.total is None
+        assert timeout.sock_connect == config.TIMEOUT
+        assert timeout.sock_read is None